@@ -1,129 +1,249 @@
-import redis
-import json
+import redis.asyncio as aioredis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+import orjson
+import zstandard
+import asyncio
+import heapq
 import logging
-from typing import Optional, Any, Dict, List
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import Optional, Any, Dict, List, Tuple
+import time
 import os
 
 logger = logging.getLogger(__name__)
 
+# Cached payloads carry a one-byte format prefix so entries written by older
+# releases (plain JSON text without a prefix) can still be read back.
+CACHE_FORMAT_ORJSON = b"\x01"
+CACHE_FORMAT_ORJSON_ZSTD = b"\x02"
+COMPRESSION_THRESHOLD = 1024  # Bytes; smaller payloads aren't worth compressing
+
+# Reused across calls; building a (de)compressor allocates its context
+zstd_compressor = zstandard.ZstdCompressor(level=3)
+zstd_decompressor = zstandard.ZstdDecompressor()
+
+def dump_cache_json(value: Any) -> bytes:
+    """Serialize a value to the JSON bytes the cache stores"""
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+def encode_cache_payload(serialized: bytes) -> bytes:
+    """Add the format prefix to JSON bytes, compressing large ones"""
+    if len(serialized) > COMPRESSION_THRESHOLD:
+        return CACHE_FORMAT_ORJSON_ZSTD + zstd_compressor.compress(serialized)
+    return CACHE_FORMAT_ORJSON + serialized
+
+def serialize_cache_value(value: Any) -> bytes:
+    """Serialize a value for storage in the cache"""
+    return encode_cache_payload(dump_cache_json(value))
+
+def decode_cache_payload(payload: bytes) -> bytes:
+    """JSON bytes held in a cached payload, without parsing them"""
+    prefix = payload[:1]
+    if prefix == CACHE_FORMAT_ORJSON:
+        return payload[1:]
+    if prefix == CACHE_FORMAT_ORJSON_ZSTD:
+        return zstd_decompressor.decompress(memoryview(payload)[1:])
+    return payload
+
+def deserialize_cache_value(payload: bytes) -> Any:
+    """Deserialize a cached payload, accepting legacy unprefixed JSON entries"""
+    prefix = payload[:1]
+    if prefix == CACHE_FORMAT_ORJSON:
+        return orjson.loads(memoryview(payload)[1:])
+    if prefix == CACHE_FORMAT_ORJSON_ZSTD:
+        return orjson.loads(zstd_decompressor.decompress(memoryview(payload)[1:]))
+    return orjson.loads(payload)
+
 class CacheManager:
+    __slots__ = ("redis_client", "cache_enabled", "default_ttl")
+    
+    SCAN_BATCH_SIZE = 500  # Keys per SCAN page and per UNLINK call
+    MAX_CONNECTIONS = 32
+    STALE_PREFIX = "stale:"
+    STALE_TTL = 86400  # Stale copies outlive the database outages they cover
+    
+    # Built once and shared by every client in the process
+    connection_pool: Optional[aioredis.ConnectionPool] = None
+    
     def __init__(self):
-        self.redis_client = None
+        # Serve from memory until connect() has been awaited at startup
+        self.redis_client = InMemoryCache()
         self.cache_enabled = True
         self.default_ttl = 3600  # 1 hour default TTL
         
-    def connect(self):
+    async def connect(self):
         """Connect to Redis"""
         try:
             # Use Redis if available, otherwise use in-memory cache
-            redis_url = os.environ.get('REDIS_URL', 'redis://localhost:6379')
-            self.redis_client = redis.from_url(redis_url, decode_responses=True)
+            if CacheManager.connection_pool is None:
+                redis_url = os.environ.get('REDIS_URL', 'redis://localhost:6379')
+                CacheManager.connection_pool = aioredis.ConnectionPool.from_url(
+                    redis_url,
+                    max_connections=self.MAX_CONNECTIONS,
+                    socket_keepalive=True,
+                    # Retry transient failures instead of tripping the fallback
+                    retry=Retry(ExponentialBackoff(), 3),
+                    retry_on_error=[RedisConnectionError, RedisTimeoutError],
+                )
+            self.redis_client = aioredis.Redis(connection_pool=CacheManager.connection_pool)
             # Test connection
-            self.redis_client.ping()
+            await self.redis_client.ping()
             logger.info("Connected to Redis successfully")
         except Exception as e:
             logger.warning(f"Redis connection failed: {e}. Using in-memory cache fallback.")
             self.redis_client = InMemoryCache()
+    
+    async def disconnect(self):
+        """Close the Redis connection pool"""
+        if CacheManager.connection_pool is not None:
+            await CacheManager.connection_pool.disconnect()
+            CacheManager.connection_pool = None
+            logger.info("Disconnected from Redis")
             
-    def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
+        value = await self.get_json(key)
+        if value:
+            return orjson.loads(value)
+        return None
+    
+    async def get_json(self, key: str) -> Optional[bytes]:
+        """Get a cached value as JSON bytes, without decoding it"""
         if not self.cache_enabled:
             return None
             
         try:
-            if not self.redis_client:
-                self.connect()
-                
-            value = self.redis_client.get(key)
+            if isinstance(self.redis_client, InMemoryCache):
+                value = self.redis_client.get(key)
+            else:
+                value = await self.redis_client.get(key)
             if value:
-                return json.loads(value)
+                return decode_cache_payload(value)
             return None
         except Exception as e:
             logger.error(f"Cache get error for key {key}: {e}")
             return None
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value in cache"""
+        return await self.set_json(key, dump_cache_json(value), ttl)
+    
+    async def set_json(self, key: str, value_json: bytes, ttl: Optional[int] = None) -> bool:
+        """Set a value that is already serialized to JSON bytes"""
         if not self.cache_enabled:
             return False
             
         try:
-            if not self.redis_client:
-                self.connect()
-                
             ttl = ttl or self.default_ttl
-            serialized_value = json.dumps(value, default=str)
+            serialized_value = encode_cache_payload(value_json)
             
-            if hasattr(self.redis_client, 'setex'):
-                # Redis client
-                self.redis_client.setex(key, ttl, serialized_value)
-            else:
-                # In-memory cache
+            if isinstance(self.redis_client, InMemoryCache):
                 self.redis_client.set(key, serialized_value, ttl)
+            else:
+                await self.redis_client.setex(key, ttl, serialized_value)
             
             return True
         except Exception as e:
             logger.error(f"Cache set error for key {key}: {e}")
             return False
     
-    def delete(self, key: str) -> bool:
+    async def get_stale(self, key: str) -> Optional[Any]:
+        """Get the long-lived stale copy of a key, for serving while the database is down"""
+        return await self.get(self.STALE_PREFIX + key)
+    
+    async def set_stale(self, key: str, value_json: bytes) -> bool:
+        """Keep a long-lived stale copy of a JSON value alongside its regular entry"""
+        return await self.set_json(self.STALE_PREFIX + key, value_json, self.STALE_TTL)
+    
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values from cache in one round-trip"""
+        if not self.cache_enabled or not keys:
+            return [None] * len(keys)
+            
+        try:
+            if isinstance(self.redis_client, InMemoryCache):
+                values = [self.redis_client.get(key) for key in keys]
+            else:
+                values = await self.redis_client.mget(keys)
+            
+            return [deserialize_cache_value(value) if value else None for value in values]
+        except Exception as e:
+            logger.error(f"Cache get_many error for keys {keys}: {e}")
+            return [None] * len(keys)
+    
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set several values in cache in one round-trip"""
+        if not self.cache_enabled:
+            return False
+            
+        try:
+            ttl = ttl or self.default_ttl
+            
+            if isinstance(self.redis_client, InMemoryCache):
+                for key, value in items.items():
+                    self.redis_client.set(key, serialize_cache_value(value), ttl)
+            else:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for key, value in items.items():
+                        pipe.setex(key, ttl, serialize_cache_value(value))
+                    await pipe.execute()
+            
+            return True
+        except Exception as e:
+            logger.error(f"Cache set_many error for keys {list(items)}: {e}")
+            return False
+    
+    async def delete(self, key: str) -> bool:
         """Delete key from cache"""
         if not self.cache_enabled:
             return False
             
         try:
-            if not self.redis_client:
-                self.connect()
-                
-            self.redis_client.delete(key)
+            if isinstance(self.redis_client, InMemoryCache):
+                self.redis_client.delete(key)
+            else:
+                await self.redis_client.delete(key)
             return True
         except Exception as e:
             logger.error(f"Cache delete error for key {key}: {e}")
             return False
     
-    def clear_pattern(self, pattern: str) -> int:
+    async def clear_pattern(self, pattern: str) -> int:
         """Clear all keys matching pattern"""
         if not self.cache_enabled:
             return 0
             
         try:
-            if not self.redis_client:
-                self.connect()
-                
-            if hasattr(self.redis_client, 'keys'):
-                # Redis client
-                keys = self.redis_client.keys(pattern)
-                if keys:
-                    return self.redis_client.delete(*keys)
-            else:
-                # In-memory cache
+            if isinstance(self.redis_client, InMemoryCache):
                 return self.redis_client.clear_pattern(pattern)
             
-            return 0
+            # SCAN doesn't block the server like KEYS, and UNLINK frees the
+            # values in the background
+            keys = [key async for key in self.redis_client.scan_iter(match=pattern, count=self.SCAN_BATCH_SIZE)]
+            deleted = 0
+            for i in range(0, len(keys), self.SCAN_BATCH_SIZE):
+                deleted += await self.redis_client.unlink(*keys[i:i + self.SCAN_BATCH_SIZE])
+            return deleted
         except Exception as e:
             logger.error(f"Cache clear pattern error for pattern {pattern}: {e}")
             return 0
     
-    def get_stats(self) -> Dict[str, Any]:
+    async def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         try:
-            if not self.redis_client:
-                self.connect()
-                
-            if hasattr(self.redis_client, 'info'):
-                # Redis client
-                info = self.redis_client.info()
-                return {
-                    "used_memory": info.get("used_memory_human", "N/A"),
-                    "connected_clients": info.get("connected_clients", 0),
-                    "total_commands_processed": info.get("total_commands_processed", 0),
-                    "cache_hits": info.get("keyspace_hits", 0),
-                    "cache_misses": info.get("keyspace_misses", 0)
-                }
-            else:
-                # In-memory cache
+            if isinstance(self.redis_client, InMemoryCache):
                 return self.redis_client.get_stats()
+            
+            info = await self.redis_client.info()
+            return {
+                "used_memory": info.get("used_memory_human", "N/A"),
+                "connected_clients": info.get("connected_clients", 0),
+                "total_commands_processed": info.get("total_commands_processed", 0),
+                "cache_hits": info.get("keyspace_hits", 0),
+                "cache_misses": info.get("keyspace_misses", 0)
+            }
                 
         except Exception as e:
             logger.error(f"Cache stats error: {e}")
@@ -131,36 +251,75 @@ class CacheManager:
 
 class InMemoryCache:
     """Fallback in-memory cache when Redis is not available"""
-    def __init__(self):
-        self.cache = {}
+    __slots__ = ("maxsize", "cache", "expiry", "_expiry_heap", "hits", "misses", "sets", "deletes")
+    
+    SWEEP_INTERVAL = 256  # Sweep expired keys every N sets
+    HEAP_SLACK = 2  # Rebuild the expiry heap once it holds this many entries per live key
+    
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self.cache = OrderedDict()  # Ordered by recency for LRU eviction
         self.expiry = {}
-        self.stats = {
-            "hits": 0,
-            "misses": 0,
-            "sets": 0,
-            "deletes": 0
-        }
+        self._expiry_heap = []  # (expiry_ts, key) min-heap, may hold stale entries
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.deletes = 0
     
-    def get(self, key: str) -> Optional[str]:
+    def get(self, key: str) -> Optional[Any]:
         """Get value from in-memory cache"""
         # Check if key exists and hasn't expired
         if key in self.cache:
-            if key not in self.expiry or datetime.now() < self.expiry[key]:
-                self.stats["hits"] += 1
+            if key not in self.expiry or time.monotonic() < self.expiry[key]:
+                self.hits += 1
+                self.cache.move_to_end(key)
                 return self.cache[key]
             else:
                 # Key has expired
                 self.delete(key)
         
-        self.stats["misses"] += 1
+        self.misses += 1
         return None
     
-    def set(self, key: str, value: str, ttl: int):
+    def set(self, key: str, value: Any, ttl: int):
         """Set value in in-memory cache"""
         self.cache[key] = value
+        self.cache.move_to_end(key)
         if ttl:
-            self.expiry[key] = datetime.now() + timedelta(seconds=ttl)
-        self.stats["sets"] += 1
+            expiry_ts = time.monotonic() + ttl
+            self.expiry[key] = expiry_ts
+            heapq.heappush(self._expiry_heap, (expiry_ts, key))
+        else:
+            self.expiry.pop(key, None)
+        self.sets += 1
+        
+        if len(self.cache) > self.maxsize:
+            evicted_key, _ = self.cache.popitem(last=False)
+            self.expiry.pop(evicted_key, None)
+        if self.sets % self.SWEEP_INTERVAL == 0:
+            self._sweep()
+            self._compact()
+    
+    def _sweep(self):
+        """Evict expired keys without scanning the whole cache"""
+        now = time.monotonic()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expiry_ts, key = heapq.heappop(heap)
+            # Skip entries superseded by a later set or already removed
+            if self.expiry.get(key) == expiry_ts:
+                del self.expiry[key]
+                self.cache.pop(key, None)
+    
+    def _compact(self):
+        """Rebuild the expiry heap from live keys once superseded entries dominate it
+        
+        Overwritten, deleted and LRU-evicted keys leave their heap entries
+        behind until they expire, which for stale copies is a day away.
+        """
+        if len(self._expiry_heap) > self.HEAP_SLACK * len(self.expiry) + self.SWEEP_INTERVAL:
+            self._expiry_heap = [(expiry_ts, key) for key, expiry_ts in self.expiry.items()]
+            heapq.heapify(self._expiry_heap)
     
     def delete(self, key: str):
         """Delete key from in-memory cache"""
@@ -168,36 +327,44 @@ class InMemoryCache:
             del self.cache[key]
         if key in self.expiry:
             del self.expiry[key]
-        self.stats["deletes"] += 1
+        self.deletes += 1
     
     def clear_pattern(self, pattern: str) -> int:
         """Clear keys matching pattern"""
-        # Simple pattern matching (only supports * wildcard)
+        # Simple pattern matching (only supports a trailing * wildcard)
         if "*" in pattern:
-            prefix = pattern.replace("*", "")
-            keys_to_delete = [k for k in self.cache.keys() if k.startswith(prefix)]
+            prefix = pattern.rstrip("*")
+            keys_to_delete = [k for k in self.cache if k.startswith(prefix)]
         else:
-            keys_to_delete = [k for k in self.cache.keys() if k == pattern]
+            keys_to_delete = [pattern] if pattern in self.cache else []
         
         for key in keys_to_delete:
-            self.delete(key)
+            self.cache.pop(key, None)
+            self.expiry.pop(key, None)
+        self.deletes += len(keys_to_delete)
         
         return len(keys_to_delete)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get in-memory cache statistics"""
+        lookups = self.hits + self.misses
         return {
             "cache_size": len(self.cache),
-            "cache_hits": self.stats["hits"],
-            "cache_misses": self.stats["misses"],
-            "cache_sets": self.stats["sets"],
-            "cache_deletes": self.stats["deletes"],
-            "hit_rate": self.stats["hits"] / (self.stats["hits"] + self.stats["misses"]) if (self.stats["hits"] + self.stats["misses"]) > 0 else 0
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_sets": self.sets,
+            "cache_deletes": self.deletes,
+            "hit_rate": self.hits / lookups if lookups > 0 else 0
         }
 
 # Global cache manager instance
 cache_manager = CacheManager()
 
+# Short-lived per-process layer in front of Redis for the hottest content keys.
+# Invalidations only reach the local process, so entries must expire quickly.
+LOCAL_CACHE_TTL = 30
+local_cache = InMemoryCache(maxsize=512)
+
 # Cache key generators
 def get_cache_key(prefix: str, identifier: str = "", **kwargs) -> str:
     """Generate cache key with prefix and optional identifier"""
@@ -215,57 +382,134 @@ def get_cache_key(prefix: str, identifier: str = "", **kwargs) -> str:
 def cache_result(key_prefix: str, ttl: Optional[int] = None):
     """Decorator to cache function results"""
     def decorator(func):
+        # Calls in progress per cache key, shared by concurrent cache misses
+        inflight: Dict[str, asyncio.Task] = {}
+        
+        async def compute(cache_key: str, args, kwargs):
+            try:
+                result = await func(*args, **kwargs)
+                if result is not None:
+                    await cache_manager.set(cache_key, result, ttl)
+                return result
+            finally:
+                inflight.pop(cache_key, None)
+        
         async def wrapper(*args, **kwargs):
             # Generate cache key
             cache_key = get_cache_key(key_prefix, **kwargs)
             
             # Try to get from cache first
-            cached_result = cache_manager.get(cache_key)
+            cached_result = await cache_manager.get(cache_key)
             if cached_result is not None:
                 return cached_result
             
-            # Call function and cache result
-            result = await func(*args, **kwargs)
-            if result is not None:
-                cache_manager.set(cache_key, result, ttl)
-            
-            return result
+            # Call function and cache result, letting concurrent misses for
+            # the same key await the one call instead of stampeding the DB.
+            # Shielded so a cancelled caller doesn't cancel it for the others.
+            task = inflight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(compute(cache_key, args, kwargs))
+                inflight[cache_key] = task
+            return await asyncio.shield(task)
         return wrapper
     return decorator
 
-# Content-specific cache functions
-async def get_cached_content(content_type: str, filters: Dict[str, Any] = None) -> Optional[List[Dict[str, Any]]]:
-    """Get cached content by type"""
-    cache_key = get_cache_key(f"content:{content_type}", **filters or {})
-    return cache_manager.get(cache_key)
+# Content-specific cache functions. Both tiers hold content as serialized
+# JSON, so a hit can be written into a response without decoding it.
+EMPTY_JSON_LIST = b"[]"
+
+async def get_cached_json(content_type: str, filters: Dict[str, Any] = None,
+                          cache_key: Optional[str] = None) -> Optional[bytes]:
+    """Get cached content as JSON bytes, by type or by a precomputed cache key
+    
+    Cached empty lists count as misses, so newly added content shows up
+    without waiting for the entry to expire.
+    """
+    cache_key = cache_key or get_cache_key(f"content:{content_type}", **filters or {})
+    cached_json = local_cache.get(cache_key)
+    if cached_json is None:
+        cached_json = await cache_manager.get_json(cache_key)
+        if cached_json is not None:
+            local_cache.set(cache_key, cached_json, LOCAL_CACHE_TTL)
+    if cached_json == EMPTY_JSON_LIST:
+        return None
+    return cached_json
+
+async def get_cached_content(content_type: str, filters: Dict[str, Any] = None,
+                             cache_key: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """Get cached content by type, or by a precomputed cache key"""
+    cached_json = await get_cached_json(content_type, filters, cache_key)
+    if cached_json is not None:
+        return orjson.loads(cached_json)
+    return None
 
-async def set_cached_content(content_type: str, content: List[Dict[str, Any]], 
-                           filters: Dict[str, Any] = None, ttl: Optional[int] = None) -> bool:
-    """Set cached content by type"""
-    cache_key = get_cache_key(f"content:{content_type}", **filters or {})
-    return cache_manager.set(cache_key, content, ttl)
+def cache_fallback_enabled() -> bool:
+    """Whether GET endpoints may serve stale copies while MongoDB is unreachable"""
+    # Read per call: .env is loaded after this module is imported
+    return os.environ.get("CACHE_FALLBACK_ENABLED", "false").lower() in ("1", "true", "yes")
+
+def cache_bypass_enabled() -> bool:
+    """Whether GET endpoints honour X-Cache-Bypass, which lets a client force a Mongo read"""
+    return os.environ.get("CACHE_BYPASS_ENABLED", "false").lower() in ("1", "true", "yes")
+
+async def set_cached_content(content_type: str, content: Any, 
+                           filters: Dict[str, Any] = None, ttl: Optional[int] = None,
+                           cache_key: Optional[str] = None) -> bytes:
+    """Set cached content by type, or by a precomputed cache key
+    
+    Returns the content serialized to JSON, for reuse in the response.
+    """
+    cache_key = cache_key or get_cache_key(f"content:{content_type}", **filters or {})
+    content_json = dump_cache_json(content)
+    local_cache.set(cache_key, content_json, min(ttl, LOCAL_CACHE_TTL) if ttl else LOCAL_CACHE_TTL)
+    if cache_fallback_enabled():
+        await asyncio.gather(
+            cache_manager.set_json(cache_key, content_json, ttl),
+            cache_manager.set_stale(cache_key, content_json),
+        )
+    else:
+        await cache_manager.set_json(cache_key, content_json, ttl)
+    return content_json
 
 async def invalidate_content_cache(content_type: str):
     """Invalidate all cached content for a specific type"""
-    pattern = f"content:{content_type}:*"
-    return cache_manager.clear_pattern(pattern)
+    # Unfiltered content is cached under the bare prefix, which the
+    # wildcard pattern does not match
+    base_key = f"content:{content_type}"
+    pattern = f"{base_key}:*"
+    local_cache.delete(base_key)
+    local_cache.clear_pattern(pattern)
+    _, cleared = await asyncio.gather(
+        cache_manager.delete(base_key),
+        cache_manager.clear_pattern(pattern),
+    )
+    return cleared
+
+# Cache policies: (min, max) TTL in seconds. Within those bounds a response's
+# TTL grows with the time it took to generate, so costly responses are kept
+# longer. See docs/cache-strategy.md.
+CACHE_POLICIES: Dict[str, Tuple[int, int]] = {
+    "short": (1, 10),
+    "normal": (10, 30),
+    "long": (30, 60),
+    "static": (3600, 3600),
+}
+
+# Seconds of extra TTL per second spent generating a response (1s per ms)
+GENERATION_TTL_FACTOR = 1000
 
-# Cache TTL configurations
-CACHE_TTL_CONFIG = {
-    "hero_content": 3600,        # 1 hour
-    "site_settings": 7200,       # 2 hours
-    "navigation": 7200,          # 2 hours
-    "footer_sections": 7200,     # 2 hours
-    "features": 1800,            # 30 minutes
-    "testimonials": 1800,        # 30 minutes
-    "process_steps": 1800,       # 30 minutes
-    "specifications": 1800,      # 30 minutes
-    "newsletter_signups": 300,   # 5 minutes
-    "contact_forms": 300,        # 5 minutes
-    "page_views": 60,            # 1 minute
-    "search_results": 600        # 10 minutes
+CONTENT_CACHE_POLICY = {
+    "site_settings": "static",
+    "footer_sections": "static",
+    "navigation": "static",
+    "features": "long",
+    "process_steps": "long",
+    "specifications": "long",
+    "hero_content": "normal",
+    "testimonials": "normal",
 }
 
-def get_cache_ttl(content_type: str) -> int:
-    """Get cache TTL for content type"""
-    return CACHE_TTL_CONFIG.get(content_type, 3600)  # Default 1 hour
\ No newline at end of file
+def get_policy_ttl(content_type: str, generation_time: float) -> int:
+    """TTL for a content type under its cache policy, given its generation time in seconds"""
+    min_ttl, max_ttl = CACHE_POLICIES[CONTENT_CACHE_POLICY.get(content_type, "normal")]
+    return int(min(max_ttl, min_ttl + generation_time * GENERATION_TTL_FACTOR))
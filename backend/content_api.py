@@ -1,7 +1,14 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, HTTPException, Query, Depends, Header
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pymongo.errors import DuplicateKeyError, PyMongoError
+from typing import List, Optional, Dict, Any, AsyncIterator
 from pydantic import BaseModel
+import asyncio
+import hashlib
+import heapq
 import logging
+import orjson
+import time
 from datetime import datetime
 
 from models import (
@@ -20,17 +27,55 @@ from models import (
 )
 
 from database import (
-    get_all_documents, get_document_by_id, create_document, 
-    update_document, delete_document, search_documents
+    get_all_documents, get_first_document, iter_documents, get_document_by_id, document_exists, create_document, 
+    update_document, bulk_update_documents, delete_document, search_documents,
+    LISTING_PROJECTION, WriteBatcher
 )
 
 from cache import (
-    get_cached_content, set_cached_content, invalidate_content_cache,
-    get_cache_ttl, cache_manager
+    get_cached_json, set_cached_content, invalidate_content_cache,
+    get_policy_ttl, cache_fallback_enabled, cache_bypass_enabled, cache_manager
 )
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Cache keys for the hot GET endpoints, matching get_cache_key(..., is_active=True)
+# Hero and site settings cache their single active document rather than a list
+HERO_CACHE_KEY = "content:hero_content:is_active:True:limit:1"
+FEATURES_CACHE_KEY = "content:features:is_active:True"
+TESTIMONIALS_CACHE_KEY = "content:testimonials:is_active:True"
+NAVIGATION_CACHE_KEY = "content:navigation:is_active:True"
+FOOTER_CACHE_KEY = "content:footer_sections:is_active:True"
+SITE_SETTINGS_CACHE_KEY = "content:site_settings:is_active:True:limit:1"
+PROCESS_STEPS_CACHE_KEY = "content:process_steps:is_active:True"
+SPECIFICATIONS_CACHE_KEY = "content:specifications:is_active:True"
+
+def response_projection(model_cls: type) -> Dict[str, int]:
+    """Inclusion projection for the fields a content endpoint returns"""
+    return {"_id": 0, **{field: 1 for field in model_cls.model_fields if field not in ("created_at", "updated_at")}}
+
+# Built once at import. Features, testimonials, process steps and navigation
+# already project onto their covering listing indexes in get_all_documents.
+HERO_PROJECTION = response_projection(HeroContent)
+SPECIFICATIONS_PROJECTION = response_projection(Specification)
+FOOTER_PROJECTION = response_projection(FooterSection)
+SITE_SETTINGS_PROJECTION = response_projection(SiteSettings)
+
+# Page views are buffered and inserted in batches off the request path.
+# Signups and contact forms are written before responding: the client is
+# told the outcome, so it must be known.
+page_view_batcher = WriteBatcher("page_views", max_size=500, max_delay_ms=1000)
+write_batchers = (page_view_batcher,)
+
+def cache_bypass(x_cache_bypass: Optional[str] = Header(None)) -> bool:
+    """Whether the request asked to skip cached reads with X-Cache-Bypass: 1
+    
+    The response is still written back to the cache, so a bypassed request
+    primes it for the next reader. The header is ignored unless
+    CACHE_BYPASS_ENABLED is set.
+    """
+    return x_cache_bypass == "1" and cache_bypass_enabled()
 
 # Response models
 class ResponseModel(BaseModel):
@@ -47,33 +92,104 @@ class PaginatedResponse(BaseModel):
     per_page: int
     total_pages: int
 
+async def stream_response(message: str, documents: AsyncIterator[Dict[str, Any]],
+                          first_document: Optional[Dict[str, Any]] = None) -> AsyncIterator[bytes]:
+    """Stream a ResponseModel body whose data list is written one document at a time
+    
+    The 200 status is sent before the first document, so a database error
+    mid-stream can't become a 500. Instead the list is closed early and
+    success and message, written after it, report the failure.
+    """
+    yield b'{"data":['
+    separator = b""
+    success = True
+    try:
+        if first_document is not None:
+            yield orjson.dumps(first_document)
+            separator = b","
+        async for doc in documents:
+            yield separator + orjson.dumps(doc)
+            separator = b","
+    except PyMongoError as e:
+        logger.error(f"Error streaming response: {e}")
+        success = False
+        message = "Response truncated by a database error"
+    yield b'],"success":' + orjson.dumps(success) + b',"message":' + orjson.dumps(message) + b'}'
+
+CONTENT_CACHE_CONTROL = "public, max-age=60"
+
+def content_etag(data_json: bytes) -> str:
+    """Weak ETag for serialized content
+    
+    Weak because the envelope message differs between cache hits and misses
+    while the data, and so the ETag, stays the same.
+    """
+    return f'W/"{hashlib.blake2b(data_json, digest_size=8).hexdigest()}"'
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Weak comparison of an ETag against an If-None-Match header"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+def json_response(message: str, data_json: bytes, if_none_match: Optional[str] = None) -> Response:
+    """Build a successful ResponseModel body around already-serialized data
+    
+    Cached content is stored as JSON, so it is spliced in as-is instead of
+    being decoded, validated against response_model and encoded again.
+    Returns an empty 304 when the client already holds the same data.
+    """
+    headers = {"ETag": content_etag(data_json), "Cache-Control": CONTENT_CACHE_CONTROL}
+    if etag_matches(headers["ETag"], if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        b'{"success":true,"message":' + orjson.dumps(message) + b',"data":' + data_json + b'}',
+        media_type="application/json",
+        headers=headers
+    )
+
+async def serve_stale(cache_key: str, label: str, error: Exception) -> ORJSONResponse:
+    """Serve the stale cached copy of a GET response while MongoDB is unreachable
+    
+    Raises the usual 500 when fallback is disabled or no stale copy exists.
+    """
+    logger.error(f"Error getting {label}: {error}")
+    stale = await cache_manager.get_stale(cache_key) if cache_fallback_enabled() else None
+    if not stale:
+        raise HTTPException(status_code=500, detail="Internal server error")
+    
+    response = ResponseModel(
+        success=True,
+        message=f"{label[0].upper()}{label[1:]} retrieved from stale cache",
+        data=stale
+    )
+    return ORJSONResponse(response.model_dump(), headers={"X-From-Stale-Cache": "1"})
+
 # Hero Content Endpoints
 @router.get("/hero", response_model=ResponseModel)
-async def get_hero_content():
+async def get_hero_content(bypass_cache: bool = Depends(cache_bypass), if_none_match: Optional[str] = Header(None)):
     """Get active hero content with caching"""
     try:
         # Check cache first
-        cached_hero = await get_cached_content("hero_content")
+        cached_hero = None if bypass_cache else await get_cached_json("hero_content", cache_key=HERO_CACHE_KEY)
         if cached_hero:
-            return ResponseModel(
-                success=True,
-                message="Hero content retrieved from cache",
-                data=cached_hero[0] if cached_hero else None
-            )
+            return json_response("Hero content retrieved from cache", cached_hero, if_none_match)
         
         # Fetch from database
-        hero_data = await get_all_documents("hero_content", {"is_active": True}, limit=1)
+        started = time.perf_counter()
+        hero_data = await get_first_document("hero_content", {"is_active": True}, projection=HERO_PROJECTION)
         if not hero_data:
             return ResponseModel(success=False, message="No hero content found")
         
         # Cache the result
-        await set_cached_content("hero_content", hero_data, ttl=get_cache_ttl("hero_content"))
+        hero_data_json = await set_cached_content("hero_content", hero_data, ttl=get_policy_ttl("hero_content", time.perf_counter() - started), cache_key=HERO_CACHE_KEY)
         
-        return ResponseModel(
-            success=True,
-            message="Hero content retrieved successfully",
-            data=hero_data[0]
-        )
+        return json_response("Hero content retrieved successfully", hero_data_json, if_none_match)
+    except PyMongoError as e:
+        return await serve_stale(HERO_CACHE_KEY, "hero content", e)
     except Exception as e:
         logger.error(f"Error getting hero content: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -82,15 +198,15 @@ async def get_hero_content():
 async def create_hero_content(hero_data: HeroContentCreate):
     """Create new hero content"""
     try:
-        # Deactivate existing hero content
-        existing_hero = await get_all_documents("hero_content", {"is_active": True})
-        for hero in existing_hero:
-            await update_document("hero_content", hero["id"], {"is_active": False})
-        
-        # Create new hero content
-        hero_dict = hero_data.dict()
-        hero_obj = HeroContent(**hero_dict)
-        created_hero = await create_document("hero_content", hero_obj.dict())
+        # Payload was validated at the endpoint boundary, so skip re-validation
+        hero_obj = HeroContent.model_construct(**hero_data.model_dump())
+        
+        # Deactivate existing hero content and create the new one concurrently;
+        # the id guard keeps the new document active whichever write lands first
+        _, created_hero = await asyncio.gather(
+            bulk_update_documents("hero_content", {"is_active": True, "id": {"$ne": hero_obj.id}}, {"is_active": False}),
+            create_document("hero_content", hero_obj),
+        )
         
         # Invalidate cache
         await invalidate_content_cache("hero_content")
@@ -106,34 +222,29 @@ async def create_hero_content(hero_data: HeroContentCreate):
 
 # Features Endpoints
 @router.get("/features", response_model=ResponseModel)
-async def get_features(category: Optional[str] = None):
+async def get_features(category: Optional[str] = None, bypass_cache: bool = Depends(cache_bypass), if_none_match: Optional[str] = Header(None)):
     """Get all active features, optionally filtered by category with caching"""
     try:
         # Create cache key based on category filter
-        cache_filters = {"category": category} if category else {}
-        cached_features = await get_cached_content("features", cache_filters)
+        cache_key = f"{FEATURES_CACHE_KEY}:category:{category}" if category else FEATURES_CACHE_KEY
+        cached_features = None if bypass_cache else await get_cached_json("features", cache_key=cache_key)
         if cached_features:
-            return ResponseModel(
-                success=True,
-                message="Features retrieved from cache",
-                data=cached_features
-            )
+            return json_response("Features retrieved from cache", cached_features, if_none_match)
         
         # Fetch from database
         filter_dict = {"is_active": True}
         if category:
             filter_dict["category"] = category
             
+        started = time.perf_counter()
         features = await get_all_documents("features", filter_dict, "order", 1)
         
         # Cache the result
-        await set_cached_content("features", features, cache_filters, ttl=get_cache_ttl("features"))
+        features_json = await set_cached_content("features", features, ttl=get_policy_ttl("features", time.perf_counter() - started), cache_key=cache_key)
         
-        return ResponseModel(
-            success=True,
-            message="Features retrieved successfully",
-            data=features
-        )
+        return json_response("Features retrieved successfully", features_json, if_none_match)
+    except PyMongoError as e:
+        return await serve_stale(cache_key, "features", e)
     except Exception as e:
         logger.error(f"Error getting features: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -142,9 +253,8 @@ async def get_features(category: Optional[str] = None):
 async def create_feature(feature_data: FeatureCreate):
     """Create a new feature"""
     try:
-        feature_dict = feature_data.dict()
-        feature_obj = Feature(**feature_dict)
-        created_feature = await create_document("features", feature_obj.dict())
+        feature_obj = Feature.model_construct(**feature_data.model_dump())
+        created_feature = await create_document("features", feature_obj)
         
         # Invalidate cache
         await invalidate_content_cache("features")
@@ -162,7 +272,7 @@ async def create_feature(feature_data: FeatureCreate):
 async def update_feature(feature_id: str, feature_data: FeatureCreate):
     """Update a feature"""
     try:
-        updated_feature = await update_document("features", feature_id, feature_data.dict())
+        updated_feature = await update_document("features", feature_id, feature_data.model_dump())
         if not updated_feature:
             raise HTTPException(status_code=404, detail="Feature not found")
         
@@ -180,30 +290,25 @@ async def update_feature(feature_id: str, feature_data: FeatureCreate):
 
 # Testimonials Endpoints
 @router.get("/testimonials", response_model=ResponseModel)
-async def get_testimonials(limit: int = Query(10, ge=1, le=100)):
+async def get_testimonials(limit: int = Query(10, ge=1, le=100), bypass_cache: bool = Depends(cache_bypass), if_none_match: Optional[str] = Header(None)):
     """Get all active testimonials with caching"""
     try:
         # Check cache first
-        cache_filters = {"limit": limit}
-        cached_testimonials = await get_cached_content("testimonials", cache_filters)
+        cache_key = f"{TESTIMONIALS_CACHE_KEY}:limit:{limit}"
+        cached_testimonials = None if bypass_cache else await get_cached_json("testimonials", cache_key=cache_key)
         if cached_testimonials:
-            return ResponseModel(
-                success=True,
-                message="Testimonials retrieved from cache",
-                data=cached_testimonials
-            )
+            return json_response("Testimonials retrieved from cache", cached_testimonials, if_none_match)
         
         # Fetch from database
+        started = time.perf_counter()
         testimonials = await get_all_documents("testimonials", {"is_active": True}, "order", 1, limit)
         
         # Cache the result
-        await set_cached_content("testimonials", testimonials, cache_filters, ttl=get_cache_ttl("testimonials"))
+        testimonials_json = await set_cached_content("testimonials", testimonials, ttl=get_policy_ttl("testimonials", time.perf_counter() - started), cache_key=cache_key)
         
-        return ResponseModel(
-            success=True,
-            message="Testimonials retrieved successfully",
-            data=testimonials
-        )
+        return json_response("Testimonials retrieved successfully", testimonials_json, if_none_match)
+    except PyMongoError as e:
+        return await serve_stale(cache_key, "testimonials", e)
     except Exception as e:
         logger.error(f"Error getting testimonials: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -212,9 +317,8 @@ async def get_testimonials(limit: int = Query(10, ge=1, le=100)):
 async def create_testimonial(testimonial_data: TestimonialCreate):
     """Create a new testimonial"""
     try:
-        testimonial_dict = testimonial_data.dict()
-        testimonial_obj = Testimonial(**testimonial_dict)
-        created_testimonial = await create_document("testimonials", testimonial_obj.dict())
+        testimonial_obj = Testimonial.model_construct(**testimonial_data.model_dump())
+        created_testimonial = await create_document("testimonials", testimonial_obj)
         
         # Invalidate cache
         await invalidate_content_cache("testimonials")
@@ -230,20 +334,28 @@ async def create_testimonial(testimonial_data: TestimonialCreate):
 
 # Process Steps Endpoints
 @router.get("/process-steps", response_model=ResponseModel)
-async def get_process_steps(step_type: Optional[str] = "process"):
-    """Get all active process steps"""
+async def get_process_steps(step_type: Optional[str] = "process", bypass_cache: bool = Depends(cache_bypass), if_none_match: Optional[str] = Header(None)):
+    """Get all active process steps with caching"""
     try:
+        # Check cache first
+        cache_key = f"{PROCESS_STEPS_CACHE_KEY}:step_type:{step_type}" if step_type else PROCESS_STEPS_CACHE_KEY
+        cached_steps = None if bypass_cache else await get_cached_json("process_steps", cache_key=cache_key)
+        if cached_steps:
+            return json_response("Process steps retrieved from cache", cached_steps, if_none_match)
+        
         filter_dict = {"is_active": True}
         if step_type:
             filter_dict["step_type"] = step_type
             
+        started = time.perf_counter()
         steps = await get_all_documents("process_steps", filter_dict, "order", 1)
         
-        return ResponseModel(
-            success=True,
-            message="Process steps retrieved successfully",
-            data=steps
-        )
+        # Cache the result
+        steps_json = await set_cached_content("process_steps", steps, ttl=get_policy_ttl("process_steps", time.perf_counter() - started), cache_key=cache_key)
+        
+        return json_response("Process steps retrieved successfully", steps_json, if_none_match)
+    except PyMongoError as e:
+        return await serve_stale(cache_key, "process steps", e)
     except Exception as e:
         logger.error(f"Error getting process steps: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -252,9 +364,11 @@ async def get_process_steps(step_type: Optional[str] = "process"):
 async def create_process_step(step_data: ProcessStepCreate):
     """Create a new process step"""
     try:
-        step_dict = step_data.dict()
-        step_obj = ProcessStep(**step_dict)
-        created_step = await create_document("process_steps", step_obj.dict())
+        step_obj = ProcessStep.model_construct(**step_data.model_dump())
+        created_step = await create_document("process_steps", step_obj)
+        
+        # Invalidate cache
+        await invalidate_content_cache("process_steps")
         
         return ResponseModel(
             success=True,
@@ -267,16 +381,23 @@ async def create_process_step(step_data: ProcessStepCreate):
 
 # Specifications Endpoints
 @router.get("/specifications", response_model=ResponseModel)
-async def get_specifications():
-    """Get all active specifications"""
+async def get_specifications(bypass_cache: bool = Depends(cache_bypass), if_none_match: Optional[str] = Header(None)):
+    """Get all active specifications with caching"""
     try:
-        specifications = await get_all_documents("specifications", {"is_active": True}, "order", 1)
+        # Check cache first
+        cached_specifications = None if bypass_cache else await get_cached_json("specifications", cache_key=SPECIFICATIONS_CACHE_KEY)
+        if cached_specifications:
+            return json_response("Specifications retrieved from cache", cached_specifications, if_none_match)
         
-        return ResponseModel(
-            success=True,
-            message="Specifications retrieved successfully",
-            data=specifications
-        )
+        started = time.perf_counter()
+        specifications = await get_all_documents("specifications", {"is_active": True}, "order", 1, projection=SPECIFICATIONS_PROJECTION)
+        
+        # Cache the result
+        specifications_json = await set_cached_content("specifications", specifications, ttl=get_policy_ttl("specifications", time.perf_counter() - started), cache_key=SPECIFICATIONS_CACHE_KEY)
+        
+        return json_response("Specifications retrieved successfully", specifications_json, if_none_match)
+    except PyMongoError as e:
+        return await serve_stale(SPECIFICATIONS_CACHE_KEY, "specifications", e)
     except Exception as e:
         logger.error(f"Error getting specifications: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -285,9 +406,11 @@ async def get_specifications():
 async def create_specification(spec_data: SpecificationCreate):
     """Create a new specification"""
     try:
-        spec_dict = spec_data.dict()
-        spec_obj = Specification(**spec_dict)
-        created_spec = await create_document("specifications", spec_obj.dict())
+        spec_obj = Specification.model_construct(**spec_data.model_dump())
+        created_spec = await create_document("specifications", spec_obj)
+        
+        # Invalidate cache
+        await invalidate_content_cache("specifications")
         
         return ResponseModel(
             success=True,
@@ -300,20 +423,29 @@ async def create_specification(spec_data: SpecificationCreate):
 
 # Navigation Endpoints
 @router.get("/navigation", response_model=ResponseModel)
-async def get_navigation(nav_type: Optional[str] = "main"):
-    """Get navigation items by type"""
+async def get_navigation(nav_type: Optional[str] = "main", bypass_cache: bool = Depends(cache_bypass), if_none_match: Optional[str] = Header(None)):
+    """Get navigation items by type with caching"""
     try:
+        # Check cache first
+        cache_key = f"{NAVIGATION_CACHE_KEY}:nav_type:{nav_type}" if nav_type else NAVIGATION_CACHE_KEY
+        cached_navigation = None if bypass_cache else await get_cached_json("navigation", cache_key=cache_key)
+        if cached_navigation:
+            return json_response("Navigation retrieved from cache", cached_navigation, if_none_match)
+        
+        # Fetch from database
         filter_dict = {"is_active": True}
         if nav_type:
             filter_dict["nav_type"] = nav_type
             
+        started = time.perf_counter()
         navigation = await get_all_documents("navigation", filter_dict, "order", 1)
         
-        return ResponseModel(
-            success=True,
-            message="Navigation retrieved successfully",
-            data=navigation
-        )
+        # Cache the result
+        navigation_json = await set_cached_content("navigation", navigation, ttl=get_policy_ttl("navigation", time.perf_counter() - started), cache_key=cache_key)
+        
+        return json_response("Navigation retrieved successfully", navigation_json, if_none_match)
+    except PyMongoError as e:
+        return await serve_stale(cache_key, "navigation", e)
     except Exception as e:
         logger.error(f"Error getting navigation: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -322,9 +454,11 @@ async def get_navigation(nav_type: Optional[str] = "main"):
 async def create_navigation_item(nav_data: NavigationItemCreate):
     """Create a new navigation item"""
     try:
-        nav_dict = nav_data.dict()
-        nav_obj = NavigationItem(**nav_dict)
-        created_nav = await create_document("navigation", nav_obj.dict())
+        nav_obj = NavigationItem.model_construct(**nav_data.model_dump())
+        created_nav = await create_document("navigation", nav_obj)
+        
+        # Invalidate cache
+        await invalidate_content_cache("navigation")
         
         return ResponseModel(
             success=True,
@@ -337,16 +471,24 @@ async def create_navigation_item(nav_data: NavigationItemCreate):
 
 # Footer Endpoints
 @router.get("/footer", response_model=ResponseModel)
-async def get_footer_sections():
-    """Get all active footer sections"""
+async def get_footer_sections(bypass_cache: bool = Depends(cache_bypass), if_none_match: Optional[str] = Header(None)):
+    """Get all active footer sections with caching"""
     try:
-        footer_sections = await get_all_documents("footer_sections", {"is_active": True}, "order", 1)
+        # Check cache first
+        cached_footer = None if bypass_cache else await get_cached_json("footer_sections", cache_key=FOOTER_CACHE_KEY)
+        if cached_footer:
+            return json_response("Footer sections retrieved from cache", cached_footer, if_none_match)
         
-        return ResponseModel(
-            success=True,
-            message="Footer sections retrieved successfully",
-            data=footer_sections
-        )
+        # Fetch from database
+        started = time.perf_counter()
+        footer_sections = await get_all_documents("footer_sections", {"is_active": True}, "order", 1, projection=FOOTER_PROJECTION)
+        
+        # Cache the result
+        footer_sections_json = await set_cached_content("footer_sections", footer_sections, ttl=get_policy_ttl("footer_sections", time.perf_counter() - started), cache_key=FOOTER_CACHE_KEY)
+        
+        return json_response("Footer sections retrieved successfully", footer_sections_json, if_none_match)
+    except PyMongoError as e:
+        return await serve_stale(FOOTER_CACHE_KEY, "footer sections", e)
     except Exception as e:
         logger.error(f"Error getting footer sections: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -355,9 +497,11 @@ async def get_footer_sections():
 async def create_footer_section(footer_data: FooterSectionCreate):
     """Create a new footer section"""
     try:
-        footer_dict = footer_data.dict()
-        footer_obj = FooterSection(**footer_dict)
-        created_footer = await create_document("footer_sections", footer_obj.dict())
+        footer_obj = FooterSection.model_construct(**footer_data.model_dump())
+        created_footer = await create_document("footer_sections", footer_obj)
+        
+        # Invalidate cache
+        await invalidate_content_cache("footer_sections")
         
         return ResponseModel(
             success=True,
@@ -373,17 +517,21 @@ async def create_footer_section(footer_data: FooterSectionCreate):
 async def newsletter_signup(signup_data: NewsletterSignupCreate):
     """Subscribe to newsletter"""
     try:
+        already_subscribed = ResponseModel(
+            success=False,
+            message="Email already subscribed to newsletter"
+        )
+        
         # Check if email already exists
-        existing_signup = await get_all_documents("newsletter_signups", {"email": signup_data.email})
-        if existing_signup:
-            return ResponseModel(
-                success=False,
-                message="Email already subscribed to newsletter"
-            )
+        if await document_exists("newsletter_signups", {"email": signup_data.email}):
+            return already_subscribed
         
-        signup_dict = signup_data.dict()
-        signup_obj = NewsletterSignup(**signup_dict)
-        created_signup = await create_document("newsletter_signups", signup_obj.dict())
+        signup_obj = NewsletterSignup.model_construct(**signup_data.model_dump())
+        try:
+            created_signup = await create_document("newsletter_signups", signup_obj)
+        except DuplicateKeyError:
+            # Lost a race with a concurrent signup; the unique email index caught it
+            return already_subscribed
         
         return ResponseModel(
             success=True,
@@ -395,19 +543,23 @@ async def newsletter_signup(signup_data: NewsletterSignupCreate):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/newsletter/subscribers", response_model=ResponseModel)
-async def get_newsletter_subscribers(status: Optional[str] = "subscribed"):
-    """Get newsletter subscribers"""
+async def get_newsletter_subscribers(status: Optional[str] = "subscribed",
+                                     limit: int = Query(1000, ge=1, le=10000)):
+    """Get newsletter subscribers, streamed as they are read"""
     try:
         filter_dict = {}
         if status:
             filter_dict["status"] = status
             
-        subscribers = await get_all_documents("newsletter_signups", filter_dict, "created_at", -1)
-        
-        return ResponseModel(
-            success=True,
-            message="Newsletter subscribers retrieved successfully",
-            data=subscribers
+        # The subscriber list grows without bound; stream it rather than build it in memory
+        subscribers = iter_documents("newsletter_signups", filter_dict, "created_at", -1, limit=limit)
+        # Fetch the first batch before committing to a 200, so an unreachable
+        # database still gets the usual 500
+        first_subscriber = await anext(subscribers, None)
+        
+        return StreamingResponse(
+            stream_response("Newsletter subscribers retrieved successfully", subscribers, first_subscriber),
+            media_type="application/json"
         )
     except Exception as e:
         logger.error(f"Error getting newsletter subscribers: {e}")
@@ -415,18 +567,26 @@ async def get_newsletter_subscribers(status: Optional[str] = "subscribed"):
 
 # Site Settings Endpoints
 @router.get("/site-settings", response_model=ResponseModel)
-async def get_site_settings():
-    """Get active site settings"""
+async def get_site_settings(bypass_cache: bool = Depends(cache_bypass), if_none_match: Optional[str] = Header(None)):
+    """Get active site settings with caching"""
     try:
-        settings = await get_all_documents("site_settings", {"is_active": True}, limit=1)
+        # Check cache first
+        cached_settings = None if bypass_cache else await get_cached_json("site_settings", cache_key=SITE_SETTINGS_CACHE_KEY)
+        if cached_settings:
+            return json_response("Site settings retrieved from cache", cached_settings, if_none_match)
+        
+        # Fetch from database
+        started = time.perf_counter()
+        settings = await get_first_document("site_settings", {"is_active": True}, projection=SITE_SETTINGS_PROJECTION)
         if not settings:
             return ResponseModel(success=False, message="No site settings found")
         
-        return ResponseModel(
-            success=True,
-            message="Site settings retrieved successfully",
-            data=settings[0]
-        )
+        # Cache the result
+        settings_json = await set_cached_content("site_settings", settings, ttl=get_policy_ttl("site_settings", time.perf_counter() - started), cache_key=SITE_SETTINGS_CACHE_KEY)
+        
+        return json_response("Site settings retrieved successfully", settings_json, if_none_match)
+    except PyMongoError as e:
+        return await serve_stale(SITE_SETTINGS_CACHE_KEY, "site settings", e)
     except Exception as e:
         logger.error(f"Error getting site settings: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -435,15 +595,16 @@ async def get_site_settings():
 async def create_site_settings(settings_data: SiteSettingsCreate):
     """Create new site settings"""
     try:
-        # Deactivate existing settings
-        existing_settings = await get_all_documents("site_settings", {"is_active": True})
-        for settings in existing_settings:
-            await update_document("site_settings", settings["id"], {"is_active": False})
+        settings_obj = SiteSettings.model_construct(**settings_data.model_dump())
         
-        # Create new settings
-        settings_dict = settings_data.dict()
-        settings_obj = SiteSettings(**settings_dict)
-        created_settings = await create_document("site_settings", settings_obj.dict())
+        # Deactivate existing settings and create the new ones concurrently
+        _, created_settings = await asyncio.gather(
+            bulk_update_documents("site_settings", {"is_active": True, "id": {"$ne": settings_obj.id}}, {"is_active": False}),
+            create_document("site_settings", settings_obj),
+        )
+        
+        # Invalidate cache
+        await invalidate_content_cache("site_settings")
         
         return ResponseModel(
             success=True,
@@ -459,9 +620,8 @@ async def create_site_settings(settings_data: SiteSettingsCreate):
 async def submit_contact_form(contact_data: ContactFormCreate):
     """Submit contact form"""
     try:
-        contact_dict = contact_data.dict()
-        contact_obj = ContactForm(**contact_dict)
-        created_contact = await create_document("contact_forms", contact_obj.dict())
+        contact_obj = ContactForm.model_construct(**contact_data.model_dump())
+        created_contact = await create_document("contact_forms", contact_obj)
         
         return ResponseModel(
             success=True,
@@ -477,14 +637,13 @@ async def submit_contact_form(contact_data: ContactFormCreate):
 async def track_page_view(page_view_data: PageViewCreate):
     """Track page view for analytics"""
     try:
-        page_view_dict = page_view_data.dict()
-        page_view_obj = PageView(**page_view_dict)
-        created_page_view = await create_document("page_views", page_view_obj.dict())
+        page_view_obj = PageView.model_construct(**page_view_data.model_dump())
+        await page_view_batcher.add(page_view_obj.model_dump())
         
         return ResponseModel(
             success=True,
-            message="Page view tracked successfully",
-            data=created_page_view
+            message="Page view queued for tracking",
+            data=page_view_obj
         )
     except Exception as e:
         logger.error(f"Error tracking page view: {e}")
@@ -494,42 +653,37 @@ async def track_page_view(page_view_data: PageViewCreate):
 @router.get("/search", response_model=ResponseModel)
 async def search_content(
     query: str = Query(..., min_length=1),
-    content_type: Optional[str] = None
+    content_type: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=1000),
+    prefix: bool = False
 ):
-    """Search across all content types"""
+    """Search across all content types; prefix=true matches titles starting with the query"""
     try:
-        results = []
-        
-        # Search in features
+        # Collections are independent, so query them concurrently
+        searches = []
         if not content_type or content_type == "features":
-            feature_results = await search_documents("features", query, ["title", "description"])
-            for result in feature_results:
-                result["content_type"] = "feature"
-                results.append(result)
-        
-        # Search in testimonials
+            searches.append(("feature", search_documents("features", query, ["title", "description"], LISTING_PROJECTION, prefix)))
         if not content_type or content_type == "testimonials":
-            testimonial_results = await search_documents("testimonials", query, ["content", "author", "role"])
-            for result in testimonial_results:
-                result["content_type"] = "testimonial"
-                results.append(result)
-        
-        # Search in process steps
+            searches.append(("testimonial", search_documents("testimonials", query, ["content", "author", "role"], LISTING_PROJECTION, prefix)))
         if not content_type or content_type == "process_steps":
-            step_results = await search_documents("process_steps", query, ["title", "description"])
-            for result in step_results:
-                result["content_type"] = "process_step"
-                results.append(result)
-        
-        # Search in specifications
+            searches.append(("process_step", search_documents("process_steps", query, ["title", "description"], LISTING_PROJECTION, prefix)))
         if not content_type or content_type == "specifications":
-            spec_results = await search_documents("specifications", query, ["section_title", "content"])
-            for result in spec_results:
-                result["content_type"] = "specification"
+            searches.append(("specification", search_documents("specifications", query, ["section_title", "content"], LISTING_PROJECTION, prefix)))
+        
+        results_per_collection = await asyncio.gather(*(search for _, search in searches))
+        
+        results = []
+        for (label, _), collection_results in zip(searches, results_per_collection):
+            for result in collection_results:
+                result["content_type"] = label
                 results.append(result)
         
-        # Sort results by relevance (this could be enhanced with better scoring)
-        results.sort(key=lambda x: x.get("order", 0))
+        # Keep the most relevant results across collections. Prefix and regex
+        # matches have no text score; the stable selection keeps their order.
+        results = heapq.nlargest(limit, results, key=lambda result: result.get("score", 0))
+        for result in results:
+            # Ranking only; not part of the returned documents
+            result.pop("score", None)
         
         return ResponseModel(
             success=True,
@@ -1,16 +1,168 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from motor.motor_asyncio import AsyncIOMotorCollection
 import os
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple, Union
+from datetime import datetime, timezone
+from pydantic import BaseModel
+from pymongo import IndexModel, ReturnDocument, ASCENDING, DESCENDING, TEXT
+from pymongo.errors import BulkWriteError, OperationFailure, PyMongoError
+from bson.codec_options import CodecOptions, DatetimeConversion
+import asyncio
 import logging
+import re
+import uuid
 
 logger = logging.getLogger(__name__)
 
+# MongoDB error code for a missing index, e.g. a $text query on a collection
+# without a text index or dropping an index that doesn't exist
+INDEX_NOT_FOUND = 27
+
+# MongoDB error code for a unique index violation
+DUPLICATE_KEY = 11000
+
+# Covering indexes for the hot listing queries (active documents sorted by
+# order). Each holds every field the list endpoints return, so MongoDB can
+# answer them from the index without fetching documents.
+LISTING_INDEXES: Dict[str, Tuple[str, List[str]]] = {
+    "features": ("features_listing", ["id", "title", "description", "icon_svg", "category"]),
+    "testimonials": ("testimonials_listing", ["id", "content", "author", "role", "company", "gradient", "background_image", "rating"]),
+    "process_steps": ("process_steps_listing", ["id", "number", "title", "description", "image_url", "step_type"]),
+    "navigation": ("navigation_listing", ["id", "label", "href", "target", "nav_type", "parent_id"]),
+}
+
+# Bookkeeping fields API listings don't need to send back
+LISTING_PROJECTION = {"_id": 0, "created_at": 0, "updated_at": 0}
+
+def without_object_id(projection: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Exclude Mongo's _id from a projection; the API addresses documents by id"""
+    return {"_id": 0, **(projection or {})}
+
+def listing_index_model(collection_name: str) -> IndexModel:
+    """Build the covering listing index for a collection"""
+    index_name, fields = LISTING_INDEXES[collection_name]
+    keys = [("is_active", ASCENDING), ("order", ASCENDING)] + [(field, ASCENDING) for field in fields]
+    return IndexModel(keys, name=index_name)
+
+def listing_projection(collection_name: str) -> Dict[str, int]:
+    """Projection restricted to the fields held by a collection's listing index"""
+    _, fields = LISTING_INDEXES[collection_name]
+    return {"_id": 0, "is_active": 1, "order": 1, **{field: 1 for field in fields}}
+
+# Fields searched by anchored prefix queries; each has a plain ascending index
+# so a case-sensitive ^prefix regex becomes an index range scan
+PREFIX_SEARCH_FIELDS: Dict[str, List[str]] = {
+    "features": ["title"],
+    "testimonials": ["author"],
+    "process_steps": ["title"],
+    "specifications": ["section_title"],
+    "content_pages": ["title", "slug"],
+}
+
+def prefix_index_models(collection_name: str) -> List[IndexModel]:
+    """Single-field indexes backing a collection's prefix search"""
+    return [IndexModel([(field, ASCENDING)]) for field in PREFIX_SEARCH_FIELDS[collection_name]]
+
+# Per-collection codec overrides. Analytics reads decode page view dates as
+# int64 milliseconds (DatetimeMS) instead of constructing datetime objects.
+COLLECTION_CODEC_OPTIONS: Dict[str, CodecOptions] = {
+    "page_views": CodecOptions(datetime_conversion=DatetimeConversion.DATETIME_MS),
+}
+
+# Indexes per collection, built by DatabaseManager.create_indexes
+INDEX_SPEC: Dict[str, List[IndexModel]] = {
+    "hero_content": [
+        IndexModel([("is_active", ASCENDING)]),
+    ],
+    # Features indexes - OPTIMIZED with compound indexes
+    "features": [
+        IndexModel([("is_active", ASCENDING), ("category", ASCENDING), ("order", ASCENDING)]),
+        IndexModel([("category", ASCENDING), ("order", ASCENDING)]),
+        # Text search index for features
+        IndexModel([("title", TEXT), ("description", TEXT)]),
+        listing_index_model("features"),
+        *prefix_index_models("features"),
+    ],
+    # Testimonials indexes - OPTIMIZED with compound indexes
+    "testimonials": [
+        IndexModel([("is_active", ASCENDING), ("rating", DESCENDING)]),
+        # Text search index for testimonials
+        IndexModel([("content", TEXT), ("author", TEXT), ("role", TEXT)]),
+        listing_index_model("testimonials"),
+        *prefix_index_models("testimonials"),
+    ],
+    # Process steps indexes - OPTIMIZED with compound indexes
+    "process_steps": [
+        IndexModel([("is_active", ASCENDING), ("step_type", ASCENDING), ("order", ASCENDING)]),
+        IndexModel([("step_type", ASCENDING), ("order", ASCENDING)]),
+        # Text search index for process steps
+        IndexModel([("title", TEXT), ("description", TEXT)]),
+        listing_index_model("process_steps"),
+        *prefix_index_models("process_steps"),
+    ],
+    # Specifications indexes - OPTIMIZED with compound indexes
+    "specifications": [
+        IndexModel([("is_active", ASCENDING), ("order", ASCENDING)]),
+        # Text search index for specifications
+        IndexModel([("section_title", TEXT), ("content", TEXT)]),
+        *prefix_index_models("specifications"),
+    ],
+    # Navigation indexes - OPTIMIZED with compound indexes
+    "navigation": [
+        IndexModel([("is_active", ASCENDING), ("nav_type", ASCENDING), ("order", ASCENDING)]),
+        IndexModel([("nav_type", ASCENDING), ("order", ASCENDING)]),
+        listing_index_model("navigation"),
+    ],
+    # Footer sections indexes - OPTIMIZED with compound indexes
+    "footer_sections": [
+        IndexModel([("is_active", ASCENDING), ("section_type", ASCENDING), ("order", ASCENDING)]),
+        IndexModel([("section_type", ASCENDING)]),
+    ],
+    # Newsletter indexes - OPTIMIZED
+    "newsletter_signups": [
+        IndexModel([("email", ASCENDING)], unique=True),
+        IndexModel([("created_at", DESCENDING)]),
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING)]),
+    ],
+    "site_settings": [
+        IndexModel([("is_active", ASCENDING)]),
+    ],
+    # Content pages indexes - OPTIMIZED
+    "content_pages": [
+        IndexModel([("slug", ASCENDING)], unique=True),
+        IndexModel([("published", ASCENDING), ("page_type", ASCENDING)]),
+        IndexModel([("title", TEXT), ("content", TEXT)]),
+        IndexModel([("title", ASCENDING)]),
+    ],
+    # Page views indexes - OPTIMIZED for analytics
+    "page_views": [
+        IndexModel([("timestamp", DESCENDING)]),
+        IndexModel([("page_path", ASCENDING), ("timestamp", DESCENDING)]),
+        IndexModel([("session_id", ASCENDING), ("timestamp", DESCENDING)]),
+    ],
+    # Contact forms indexes - OPTIMIZED
+    "contact_forms": [
+        IndexModel([("created_at", DESCENDING)]),
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("email", ASCENDING)]),
+    ],
+}
+
+# Indexes dropped from INDEX_SPEC that existing deployments still carry.
+# (is_active, order) is a prefix of each collection's covering listing index,
+# and each single-field filter index is a prefix of its (field, order) index.
+OBSOLETE_INDEXES: Dict[str, List[str]] = {
+    "features": ["is_active_1_order_1", "category_1"],
+    "testimonials": ["is_active_1_order_1"],
+    "process_steps": ["is_active_1_order_1", "step_type_1"],
+    "navigation": ["nav_type_1"],
+}
+
 class DatabaseManager:
     def __init__(self):
         self.client: Optional[AsyncIOMotorClient] = None
         self.db = None
+        self.collections: Dict[str, AsyncIOMotorCollection] = {}
         
     async def connect(self):
         """Connect to MongoDB"""
@@ -19,102 +171,80 @@ class DatabaseManager:
             if not mongo_url:
                 raise ValueError("MONGO_URL environment variable is not set")
             
-            self.client = AsyncIOMotorClient(mongo_url)
+            # Each worker process has its own pool; split the total connection
+            # budget between them so adding workers doesn't add connections
+            workers = max(1, int(os.environ.get('WEB_CONCURRENCY', 1)))
+            total_pool_size = int(os.environ.get('MONGO_TOTAL_POOL_SIZE', 50))
+            max_pool_size = int(os.environ.get('MONGO_MAX_POOL_SIZE', max(1, total_pool_size // workers)))
+            
+            # Warm pool and wire compression (icon_svg and friends compress well);
+            # fail fast on server selection instead of the 30s driver default
+            self.client = AsyncIOMotorClient(
+                mongo_url,
+                maxPoolSize=max_pool_size,
+                minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', min(10, max_pool_size))),
+                compressors="zstd,zlib",
+                serverSelectionTimeoutMS=int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', 5000)),
+                maxIdleTimeMS=int(os.environ.get('MONGO_MAX_IDLE_TIME_MS', 60000)),
+                appname=os.environ.get('APP_NAME', 'atlas-backend'),
+            )
             self.db = self.client[os.environ.get('DB_NAME', 'test_database')]
+            # Build collection handles once rather than on every request
+            self.collections = {collection_name: self._open_collection(collection_name) for collection_name in INDEX_SPEC}
             
             # Test the connection
             await self.client.admin.command('ping')
             logger.info("Connected to MongoDB successfully")
+            await self.warm_up()
             
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
             raise
     
+    async def warm_up(self):
+        """Open pooled sockets before the first request by touching every collection at once"""
+        try:
+            await asyncio.gather(*(
+                collection.find_one({}, {"_id": 1}) for collection in self.collections.values()
+            ))
+        except Exception as e:
+            logger.warning(f"MongoDB connection pool warm-up failed: {e}")
+    
     async def disconnect(self):
         """Disconnect from MongoDB"""
         if self.client:
             self.client.close()
+            self.collections.clear()
             logger.info("Disconnected from MongoDB")
     
-    async def get_collection(self, collection_name: str) -> AsyncIOMotorCollection:
-        """Get a collection from the database"""
-        if self.db is None:
-            await self.connect()
-        return self.db[collection_name]
+    def get_collection(self, collection_name: str) -> AsyncIOMotorCollection:
+        """Get a collection from the database; connect() must have run at startup"""
+        collection = self.collections.get(collection_name)
+        if collection is None:
+            if self.db is None:
+                raise RuntimeError("Database is not connected; call db_manager.connect() first")
+            collection = self.collections[collection_name] = self._open_collection(collection_name)
+        return collection
+    
+    def _open_collection(self, collection_name: str) -> AsyncIOMotorCollection:
+        """Build a collection handle with any codec overrides applied"""
+        return self.db.get_collection(collection_name, codec_options=COLLECTION_CODEC_OPTIONS.get(collection_name))
     
     async def create_indexes(self):
         """Create necessary indexes for performance"""
         try:
-            # Hero content indexes
-            hero_collection = await self.get_collection("hero_content")
-            await hero_collection.create_index([("is_active", 1)])
+            # One createIndexes command per collection, all collections in parallel
+            collections = [self.get_collection(collection_name) for collection_name in INDEX_SPEC]
+            await asyncio.gather(*(
+                collection.create_indexes(indexes)
+                for collection, indexes in zip(collections, INDEX_SPEC.values())
+            ))
             
-            # Features indexes - OPTIMIZED with compound indexes
-            features_collection = await self.get_collection("features")
-            await features_collection.create_index([("is_active", 1), ("order", 1)])
-            await features_collection.create_index([("is_active", 1), ("category", 1), ("order", 1)])
-            await features_collection.create_index([("category", 1)])
-            # Text search index for features
-            await features_collection.create_index([("title", "text"), ("description", "text")])
-            
-            # Testimonials indexes - OPTIMIZED with compound indexes
-            testimonials_collection = await self.get_collection("testimonials")
-            await testimonials_collection.create_index([("is_active", 1), ("order", 1)])
-            await testimonials_collection.create_index([("is_active", 1), ("rating", -1)])
-            # Text search index for testimonials
-            await testimonials_collection.create_index([("content", "text"), ("author", "text"), ("role", "text")])
-            
-            # Process steps indexes - OPTIMIZED with compound indexes
-            process_steps_collection = await self.get_collection("process_steps")
-            await process_steps_collection.create_index([("is_active", 1), ("order", 1)])
-            await process_steps_collection.create_index([("is_active", 1), ("step_type", 1), ("order", 1)])
-            await process_steps_collection.create_index([("step_type", 1)])
-            # Text search index for process steps
-            await process_steps_collection.create_index([("title", "text"), ("description", "text")])
-            
-            # Specifications indexes - OPTIMIZED with compound indexes
-            specifications_collection = await self.get_collection("specifications")
-            await specifications_collection.create_index([("is_active", 1), ("order", 1)])
-            # Text search index for specifications
-            await specifications_collection.create_index([("section_title", "text"), ("content", "text")])
-            
-            # Navigation indexes - OPTIMIZED with compound indexes
-            navigation_collection = await self.get_collection("navigation")
-            await navigation_collection.create_index([("is_active", 1), ("nav_type", 1), ("order", 1)])
-            await navigation_collection.create_index([("nav_type", 1)])
-            
-            # Footer sections indexes - OPTIMIZED with compound indexes
-            footer_collection = await self.get_collection("footer_sections")
-            await footer_collection.create_index([("is_active", 1), ("section_type", 1), ("order", 1)])
-            await footer_collection.create_index([("section_type", 1)])
-            
-            # Newsletter indexes - OPTIMIZED
-            newsletter_collection = await self.get_collection("newsletter_signups")
-            await newsletter_collection.create_index([("email", 1)], unique=True)
-            await newsletter_collection.create_index([("created_at", -1)])
-            await newsletter_collection.create_index([("status", 1), ("created_at", -1)])
-            
-            # Site settings indexes
-            site_settings_collection = await self.get_collection("site_settings")
-            await site_settings_collection.create_index([("is_active", 1)])
-            
-            # Content pages indexes - OPTIMIZED
-            content_pages_collection = await self.get_collection("content_pages")
-            await content_pages_collection.create_index([("slug", 1)], unique=True)
-            await content_pages_collection.create_index([("published", 1), ("page_type", 1)])
-            await content_pages_collection.create_index([("title", "text"), ("content", "text")])
-            
-            # Page views indexes - OPTIMIZED for analytics
-            page_views_collection = await self.get_collection("page_views")
-            await page_views_collection.create_index([("timestamp", -1)])
-            await page_views_collection.create_index([("page_path", 1), ("timestamp", -1)])
-            await page_views_collection.create_index([("session_id", 1), ("timestamp", -1)])
-            
-            # Contact forms indexes - OPTIMIZED
-            contact_forms_collection = await self.get_collection("contact_forms")
-            await contact_forms_collection.create_index([("created_at", -1)])
-            await contact_forms_collection.create_index([("status", 1), ("created_at", -1)])
-            await contact_forms_collection.create_index([("email", 1)])
+            await asyncio.gather(*(
+                self.drop_index_if_exists(collection_name, index_name)
+                for collection_name, index_names in OBSOLETE_INDEXES.items()
+                for index_name in index_names
+            ))
             
             logger.info("Database indexes created successfully with performance optimizations")
             
@@ -122,102 +252,303 @@ class DatabaseManager:
             logger.error(f"Failed to create indexes: {e}")
             raise
 
+    async def drop_index_if_exists(self, collection_name: str, index_name: str):
+        """Drop an index that is no longer in INDEX_SPEC, if this database still has it"""
+        try:
+            await self.get_collection(collection_name).drop_index(index_name)
+            logger.info(f"Dropped obsolete index {collection_name}.{index_name}")
+        except OperationFailure as e:
+            if e.code != INDEX_NOT_FOUND:
+                raise
+
 # Global database manager instance
 db_manager = DatabaseManager()
 
 # Helper functions for common database operations
 async def get_all_documents(collection_name: str, filter_dict: Dict[str, Any] = None, 
                           sort_field: str = "order", sort_direction: int = 1, 
-                          limit: int = 1000) -> List[Dict[str, Any]]:
-    """Get all documents from a collection with optional filtering and sorting"""
-    collection = await db_manager.get_collection(collection_name)
+                          limit: int = 1000, projection: Optional[Dict[str, Any]] = None,
+                          hint: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Get all documents from a collection with optional filtering, sorting and projection
+    
+    Listings sorted by order on collections with a covering index default to
+    that index's fields. Unfiltered active listings are pinned to the covering
+    index, so the query is served from the index alone; filtered ones are left
+    to the planner, which can seek on the filter field's own index instead.
+    """
     filter_dict = filter_dict or {"is_active": True}
     
-    cursor = collection.find(filter_dict).sort(sort_field, sort_direction).limit(limit)
-    documents = await cursor.to_list(length=limit)
+    if projection is None and sort_field == "order" and collection_name in LISTING_INDEXES:
+        projection = listing_projection(collection_name)
+        if filter_dict == {"is_active": True}:
+            hint = hint or LISTING_INDEXES[collection_name][0]
+    projection = without_object_id(projection)
     
-    # Convert ObjectId to string
-    for doc in documents:
-        if '_id' in doc:
-            doc['_id'] = str(doc['_id'])
+    collection = db_manager.get_collection(collection_name)
+    cursor = collection.find(filter_dict, projection).sort(sort_field, sort_direction).limit(limit)
+    if hint:
+        cursor = cursor.hint(hint)
+    # The cursor is already limited; don't cap the list a second time
+    return await cursor.to_list(length=None)
+
+async def get_first_document(collection_name: str, filter_dict: Dict[str, Any] = None,
+                             sort_field: str = "order", sort_direction: int = 1,
+                             projection: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Get the first matching document with find_one, for endpoints that return a single document"""
+    filter_dict = filter_dict or {"is_active": True}
+    projection = without_object_id(projection)
     
-    return documents
+    collection = db_manager.get_collection(collection_name)
+    return await collection.find_one(filter_dict, projection, sort=[(sort_field, sort_direction)])
+
+async def iter_documents(collection_name: str, filter_dict: Dict[str, Any] = None,
+                         sort_field: str = "order", sort_direction: int = 1,
+                         limit: Optional[int] = None, projection: Optional[Dict[str, Any]] = None,
+                         batch_size: int = 100) -> AsyncIterator[Dict[str, Any]]:
+    """Yield documents as the cursor fetches them, batch_size at a time, instead of building a list"""
+    collection = db_manager.get_collection(collection_name)
+    cursor = collection.find(filter_dict or {"is_active": True}, without_object_id(projection))
+    cursor = cursor.sort(sort_field, sort_direction).batch_size(batch_size)
+    if limit:
+        cursor = cursor.limit(limit)
+    async for doc in cursor:
+        yield doc
 
 async def get_document_by_id(collection_name: str, document_id: str) -> Optional[Dict[str, Any]]:
     """Get a single document by ID"""
-    collection = await db_manager.get_collection(collection_name)
-    doc = await collection.find_one({"id": document_id})
-    
-    # Convert ObjectId to string
-    if doc and '_id' in doc:
-        doc['_id'] = str(doc['_id'])
-    
-    return doc
+    collection = db_manager.get_collection(collection_name)
+    return await collection.find_one({"id": document_id}, without_object_id())
 
-async def create_document(collection_name: str, document: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a new document"""
-    collection = await db_manager.get_collection(collection_name)
-    document["created_at"] = datetime.utcnow()
-    document["updated_at"] = datetime.utcnow()
-    
-    result = await collection.insert_one(document)
-    if result.inserted_id:
-        doc = await collection.find_one({"_id": result.inserted_id})
-        if doc and '_id' in doc:
-            doc['_id'] = str(doc['_id'])
-        return doc
+async def document_exists(collection_name: str, filter_dict: Dict[str, Any]) -> bool:
+    """Check whether any document matches a filter without fetching it"""
+    collection = db_manager.get_collection(collection_name)
+    return await collection.count_documents(filter_dict, limit=1) > 0
+
+async def create_document(collection_name: str, document: Union[BaseModel, Dict[str, Any]]) -> Dict[str, Any]:
+    """Create a new document from a dict or a Pydantic model"""
+    collection = db_manager.get_collection(collection_name)
+    if isinstance(document, BaseModel):
+        # Python mode keeps datetimes native so BSON encodes them directly
+        document = document.model_dump(mode="python")
+    now = datetime.now(timezone.utc)
+    document["created_at"] = now
+    document["updated_at"] = now
+    
+    # insert_one sets the generated _id on the document itself
+    await collection.insert_one(document)
+    document['_id'] = str(document['_id'])
     return document
 
-async def update_document(collection_name: str, document_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Update a document by ID"""
-    collection = await db_manager.get_collection(collection_name)
-    update_data["updated_at"] = datetime.utcnow()
+def batch_uuids(n: int) -> List[str]:
+    """Generate n random (version 4) UUID strings from a single urandom read"""
+    raw = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=raw[i * 16:(i + 1) * 16], version=4)) for i in range(n)]
+
+async def bulk_create(collection_name: str, documents: List[Dict[str, Any]]) -> int:
+    """Create many documents in a single round-trip"""
+    if not documents:
+        return 0
+    collection = db_manager.get_collection(collection_name)
+    now = datetime.now(timezone.utc)
+    missing_ids = [document for document in documents if "id" not in document]
+    for document, new_id in zip(missing_ids, batch_uuids(len(missing_ids))):
+        document["id"] = new_id
+    for document in documents:
+        document["created_at"] = now
+        document["updated_at"] = now
+    
+    # Unordered so one bad document doesn't stop the rest of the batch
+    result = await collection.insert_many(documents, ordered=False, bypass_document_validation=True)
+    return len(result.inserted_ids)
+
+async def update_document(collection_name: str, document_id: str, update_data: Dict[str, Any],
+                          projection: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Update a document by ID and return it as updated"""
+    collection = db_manager.get_collection(collection_name)
+    update_data["updated_at"] = datetime.now(timezone.utc)
     
-    result = await collection.update_one(
+    doc = await collection.find_one_and_update(
         {"id": document_id},
-        {"$set": update_data}
+        {"$set": update_data},
+        projection=without_object_id(projection),
+        return_document=ReturnDocument.AFTER
     )
+    return doc
+
+async def bulk_update_documents(collection_name: str, filter_dict: Dict[str, Any], update_data: Dict[str, Any]) -> int:
+    """Update every document matching a filter in a single round-trip"""
+    collection = db_manager.get_collection(collection_name)
+    update_data["updated_at"] = datetime.now(timezone.utc)
     
-    if result.modified_count > 0:
-        doc = await collection.find_one({"id": document_id})
-        if doc and '_id' in doc:
-            doc['_id'] = str(doc['_id'])
-        return doc
-    return None
+    result = await collection.update_many(filter_dict, {"$set": update_data})
+    return result.modified_count
 
 async def delete_document(collection_name: str, document_id: str) -> bool:
     """Delete a document by ID (soft delete by setting is_active to False)"""
-    collection = await db_manager.get_collection(collection_name)
-    result = await collection.update_one(
+    collection = db_manager.get_collection(collection_name)
+    doc = await collection.find_one_and_update(
         {"id": document_id},
-        {"$set": {"is_active": False, "updated_at": datetime.utcnow()}}
+        {"$set": {"is_active": False, "updated_at": datetime.now(timezone.utc)}},
+        projection={"_id": 1}
     )
-    return result.modified_count > 0
+    return doc is not None
 
 async def search_documents(collection_name: str, search_query: str, 
-                         search_fields: List[str] = None) -> List[Dict[str, Any]]:
-    """Search documents using text search"""
-    collection = await db_manager.get_collection(collection_name)
-    search_fields = search_fields or ["title", "description", "content"]
-    
-    # Create text search query
-    or_conditions = []
-    for field in search_fields:
-        or_conditions.append({field: {"$regex": search_query, "$options": "i"}})
-    
-    filter_dict = {
-        "$and": [
-            {"is_active": True},
-            {"$or": or_conditions}
-        ]
-    }
-    
-    cursor = collection.find(filter_dict).sort("order", 1)
-    documents = await cursor.to_list(length=1000)
-    
-    # Convert ObjectId to string
-    for doc in documents:
-        if '_id' in doc:
-            doc['_id'] = str(doc['_id'])
-    
-    return documents
\ No newline at end of file
+                         search_fields: List[str] = None,
+                         projection: Optional[Dict[str, Any]] = None,
+                         prefix: bool = False) -> List[Dict[str, Any]]:
+    """Search documents using the collection's text index
+    
+    Text matches carry their relevance as score, best first. Collections
+    without a text index fall back to a regex scan over search_fields.
+    With prefix=True, matches documents whose PREFIX_SEARCH_FIELDS start with the
+    query (case-sensitive), which MongoDB answers from those fields' indexes.
+    """
+    collection = db_manager.get_collection(collection_name)
+    projection = without_object_id(projection)
+    
+    if prefix:
+        # Anchored and case-sensitive, so each $or arm is an index range scan
+        pattern = f"^{re.escape(search_query)}"
+        fields = PREFIX_SEARCH_FIELDS.get(collection_name) or search_fields or ["title"]
+        filter_dict = {"is_active": True, "$or": [{field: {"$regex": pattern}} for field in fields]}
+        cursor = collection.find(filter_dict, projection).sort("order", 1)
+        return await cursor.to_list(length=1000)
+    
+    try:
+        filter_dict = {"$text": {"$search": search_query}, "is_active": True}
+        text_projection = {**projection, "score": {"$meta": "textScore"}}
+        cursor = collection.find(filter_dict, text_projection).sort([("score", {"$meta": "textScore"})])
+        documents = await cursor.to_list(length=1000)
+    except OperationFailure as e:
+        if e.code != INDEX_NOT_FOUND:
+            raise
+        search_fields = search_fields or ["title", "description", "content"]
+        
+        # Create regex search query
+        or_conditions = []
+        for field in search_fields:
+            or_conditions.append({field: {"$regex": search_query, "$options": "i"}})
+        
+        filter_dict = {
+            "$and": [
+                {"is_active": True},
+                {"$or": or_conditions}
+            ]
+        }
+        
+        cursor = collection.find(filter_dict, projection).sort("order", 1)
+        documents = await cursor.to_list(length=1000)
+    
+    return documents
+
+class WriteBatcher:
+    """Buffers inserts into one collection and writes them in batches
+    
+    add() returns as soon as the document is buffered; a background task
+    writes the buffer with a single unordered insert_many once max_size
+    documents are waiting or max_delay_ms has passed, whichever comes first.
+    Only suitable for writes the caller doesn't need to confirm, such as
+    analytics events.
+    """
+    
+    # Queued by stop() behind everything already buffered
+    _STOP = object()
+    
+    def __init__(self, collection_name: str, max_size: int = 100, max_delay_ms: int = 50,
+                 max_pending: int = 10000, max_retries: int = 3, retry_delay_ms: int = 500):
+        self.collection_name = collection_name
+        self.max_size = max_size
+        self.max_delay = max_delay_ms / 1000
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay_ms / 1000
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._task: Optional[asyncio.Task] = None
+    
+    async def add(self, document: Dict[str, Any]):
+        """Buffer a document for the next batch"""
+        try:
+            self.queue.put_nowait(document)
+        except asyncio.QueueFull:
+            # Writer is falling behind; write directly rather than drop the document
+            await self.write([document])
+    
+    async def write(self, batch: List[Dict[str, Any]]):
+        """Insert a batch, retrying the documents that failed, and log rather than raise
+        
+        Database errors are retried with exponential backoff. The insert is
+        unordered, so documents rejected by a unique index don't stop the
+        rest of the batch; they are skipped, not retried.
+        insert_many sets _id on each document, so a retry after a partial
+        write can't insert the same document twice.
+        """
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+            try:
+                await bulk_create(self.collection_name, batch)
+                return
+            except BulkWriteError as e:
+                errors = e.details.get("writeErrors", [])
+                duplicates = sum(1 for error in errors if error.get("code") == DUPLICATE_KEY)
+                if duplicates:
+                    logger.info(f"Skipped {duplicates} duplicate {self.collection_name} documents")
+                batch = [batch[error["index"]] for error in errors if error.get("code") != DUPLICATE_KEY]
+                if not batch:
+                    return
+                error = e
+            except PyMongoError as e:
+                error = e
+            except Exception as e:
+                logger.error(f"Error writing {len(batch)} {self.collection_name} documents: {e}")
+                return
+            logger.warning(f"Attempt {attempt + 1} to write {len(batch)} {self.collection_name} documents failed: {error}")
+        logger.error(f"Dropped {len(batch)} {self.collection_name} documents after {self.max_retries + 1} attempts")
+    
+    async def run(self):
+        """Write buffered documents until stop() is queued, finishing the current batch first"""
+        loop = asyncio.get_running_loop()
+        while True:
+            document = await self.queue.get()
+            if document is self._STOP:
+                return
+            batch = [document]
+            stopping = False
+            deadline = loop.time() + self.max_delay
+            try:
+                while len(batch) < self.max_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    document = await asyncio.wait_for(self.queue.get(), timeout)
+                    if document is self._STOP:
+                        stopping = True
+                        break
+                    batch.append(document)
+            except asyncio.TimeoutError:
+                pass
+            await self.write(batch)
+            if stopping:
+                return
+    
+    def start(self):
+        """Start the background writer"""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+    
+    async def stop(self):
+        """Stop the background writer once it has written everything buffered"""
+        if self._task is not None:
+            # Not cancelled: a batch being written when stop() is called would be lost
+            await self.queue.put(self._STOP)
+            await self._task
+            self._task = None
+        await self.flush()
+    
+    async def flush(self):
+        """Write every buffered document now"""
+        batch = []
+        while not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        if batch:
+            await self.write(batch)
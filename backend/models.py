@@ -1,16 +1,42 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, create_model, model_validator
+from typing import List, Optional, Dict, Any, Tuple, Type
+from datetime import datetime, timezone
 import uuid
 
+def utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime"""
+    return datetime.now(timezone.utc)
+
 # Base model for all content with common fields
 class ContentBase(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=False, use_enum_values=True)
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     is_active: bool = True
     order: int = 0
 
+    @model_validator(mode="after")
+    def updated_at_defaults_to_created_at(self) -> "ContentBase":
+        """A new document's updated_at matches its created_at, not a second clock read"""
+        if "updated_at" not in self.model_fields_set:
+            self.updated_at = self.created_at
+        return self
+
+# Server-managed fields that clients never send on create
+CREATE_EXCLUDE = ("id", "created_at", "updated_at", "is_active")
+# Only listings are sorted by order; single documents and submissions keep the default
+UNORDERED_CREATE_EXCLUDE = CREATE_EXCLUDE + ("order",)
+
+def make_create(model_cls: Type[BaseModel], exclude: Tuple[str, ...] = CREATE_EXCLUDE) -> Type[BaseModel]:
+    """Build the create payload model for a content model, minus server-managed fields"""
+    return create_model(
+        f"{model_cls.__name__}Create",
+        __base__=BaseModel,
+        **{name: (field.annotation, field) for name, field in model_cls.model_fields.items() if name not in exclude},
+    )
+
 # Hero Section Model
 class HeroContent(ContentBase):
     title: str
@@ -22,15 +48,7 @@ class HeroContent(ContentBase):
     lottie_animation_url: Optional[str] = None
     hero_image: Optional[str] = None
 
-class HeroContentCreate(BaseModel):
-    title: str
-    subtitle: str
-    description: str
-    cta_text: str
-    cta_link: str
-    background_image: str
-    lottie_animation_url: Optional[str] = None
-    hero_image: Optional[str] = None
+HeroContentCreate = make_create(HeroContent, exclude=UNORDERED_CREATE_EXCLUDE)
 
 # Features Model
 class Feature(ContentBase):
@@ -39,12 +57,7 @@ class Feature(ContentBase):
     icon_svg: str
     category: str = "general"
 
-class FeatureCreate(BaseModel):
-    title: str
-    description: str
-    icon_svg: str
-    category: str = "general"
-    order: int = 0
+FeatureCreate = make_create(Feature)
 
 # Testimonials Model
 class Testimonial(ContentBase):
@@ -56,15 +69,7 @@ class Testimonial(ContentBase):
     background_image: str
     rating: int = 5
 
-class TestimonialCreate(BaseModel):
-    content: str
-    author: str
-    role: str
-    company: str
-    gradient: str
-    background_image: str
-    rating: int = 5
-    order: int = 0
+TestimonialCreate = make_create(Testimonial)
 
 # How It Works / Steps Model
 class ProcessStep(ContentBase):
@@ -74,13 +79,7 @@ class ProcessStep(ContentBase):
     image_url: str
     step_type: str = "process"
 
-class ProcessStepCreate(BaseModel):
-    number: str
-    title: str
-    description: str
-    image_url: str
-    step_type: str = "process"
-    order: int = 0
+ProcessStepCreate = make_create(ProcessStep)
 
 # Specifications Model
 class Specification(ContentBase):
@@ -90,13 +89,7 @@ class Specification(ContentBase):
     section_number: str
     background_image: Optional[str] = None
 
-class SpecificationCreate(BaseModel):
-    section_title: str
-    section_subtitle: str
-    content: str
-    section_number: str
-    background_image: Optional[str] = None
-    order: int = 0
+SpecificationCreate = make_create(Specification)
 
 # Navigation Model
 class NavigationItem(ContentBase):
@@ -106,13 +99,7 @@ class NavigationItem(ContentBase):
     nav_type: str = "main"  # main, footer, mobile
     parent_id: Optional[str] = None
 
-class NavigationItemCreate(BaseModel):
-    label: str
-    href: str
-    target: str = "_self"
-    nav_type: str = "main"
-    parent_id: Optional[str] = None
-    order: int = 0
+NavigationItemCreate = make_create(NavigationItem)
 
 # Footer Model
 class FooterSection(ContentBase):
@@ -121,12 +108,7 @@ class FooterSection(ContentBase):
     section_type: str  # about, contact, social, legal
     links: List[Dict[str, str]] = []
 
-class FooterSectionCreate(BaseModel):
-    title: str
-    content: str
-    section_type: str
-    links: List[Dict[str, str]] = []
-    order: int = 0
+FooterSectionCreate = make_create(FooterSection)
 
 # Newsletter Model
 class NewsletterSignup(ContentBase):
@@ -136,11 +118,7 @@ class NewsletterSignup(ContentBase):
     source: str = "website"
     status: str = "subscribed"  # subscribed, unsubscribed, pending
 
-class NewsletterSignupCreate(BaseModel):
-    email: str
-    name: Optional[str] = None
-    interests: List[str] = []
-    source: str = "website"
+NewsletterSignupCreate = make_create(NewsletterSignup, exclude=UNORDERED_CREATE_EXCLUDE + ("status",))
 
 # Site Settings Model
 class SiteSettings(ContentBase):
@@ -156,18 +134,7 @@ class SiteSettings(ContentBase):
     analytics_code: Optional[str] = None
     seo_keywords: List[str] = []
 
-class SiteSettingsCreate(BaseModel):
-    site_title: str
-    site_description: str
-    logo_url: str
-    favicon_url: str
-    primary_color: str
-    secondary_color: str
-    contact_email: str
-    contact_phone: Optional[str] = None
-    social_links: Dict[str, str] = {}
-    analytics_code: Optional[str] = None
-    seo_keywords: List[str] = []
+SiteSettingsCreate = make_create(SiteSettings, exclude=UNORDERED_CREATE_EXCLUDE)
 
 # Content Management Model for CMS functionality
 class ContentPage(ContentBase):
@@ -180,15 +147,7 @@ class ContentPage(ContentBase):
     featured_image: Optional[str] = None
     page_type: str = "standard"  # standard, landing, blog, etc.
 
-class ContentPageCreate(BaseModel):
-    title: str
-    slug: str
-    content: str
-    meta_description: str
-    meta_keywords: List[str] = []
-    published: bool = True
-    featured_image: Optional[str] = None
-    page_type: str = "standard"
+ContentPageCreate = make_create(ContentPage, exclude=UNORDERED_CREATE_EXCLUDE)
 
 # Analytics Model for tracking
 class PageView(BaseModel):
@@ -197,19 +156,12 @@ class PageView(BaseModel):
     referrer: Optional[str] = None
     user_agent: Optional[str] = None
     ip_address: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
     session_id: Optional[str] = None
     country: Optional[str] = None
     device_type: Optional[str] = None
 
-class PageViewCreate(BaseModel):
-    page_path: str
-    referrer: Optional[str] = None
-    user_agent: Optional[str] = None
-    ip_address: Optional[str] = None
-    session_id: Optional[str] = None
-    country: Optional[str] = None
-    device_type: Optional[str] = None
+PageViewCreate = make_create(PageView, exclude=("id", "timestamp"))
 
 # Contact Form Model
 class ContactForm(ContentBase):
@@ -221,10 +173,4 @@ class ContactForm(ContentBase):
     company: Optional[str] = None
     status: str = "new"  # new, in_progress, resolved, closed
 
-class ContactFormCreate(BaseModel):
-    name: str
-    email: str
-    subject: str
-    message: str
-    phone: Optional[str] = None
-    company: Optional[str] = None
\ No newline at end of file
+ContactFormCreate = make_create(ContactForm, exclude=UNORDERED_CREATE_EXCLUDE + ("status",))
@@ -17,9 +17,25 @@ sys.path.append(str(Path(__file__).parent))
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-from database import db_manager, create_document
+from database import db_manager, bulk_create
 from models import *
 
+# Fields bulk_create assigns at insert time
+SERVER_FIELDS = ("id", "created_at", "updated_at")
+
+def stamp(model_cls, data):
+    """Fill a seed document with its model's defaults without running validation
+
+    Seed data is authored here and trusted, so it skips Pydantic; bulk_create
+    adds the ids and timestamps.
+    """
+    defaults = {
+        name: field.get_default(call_default_factory=True)
+        for name, field in model_cls.model_fields.items()
+        if not field.is_required() and name not in SERVER_FIELDS
+    }
+    return {**defaults, **data}
+
 async def seed_hero_content():
     """Seed hero section content"""
     print("Seeding hero content...")
@@ -36,8 +52,7 @@ async def seed_hero_content():
         "order": 1
     }
     
-    hero_obj = HeroContent(**hero_data)
-    await create_document("hero_content", hero_obj.dict())
+    await bulk_create("hero_content", [stamp(HeroContent, hero_data)])
     print("✓ Hero content seeded")
 
 async def seed_features():
@@ -89,9 +104,7 @@ async def seed_features():
         }
     ]
     
-    for feature_data in features_data:
-        feature_obj = Feature(**feature_data)
-        await create_document("features", feature_obj.dict())
+    await bulk_create("features", [stamp(Feature, feature_data) for feature_data in features_data])
     
     print(f"✓ {len(features_data)} features seeded")
 
@@ -142,9 +155,7 @@ async def seed_testimonials():
         }
     ]
     
-    for testimonial_data in testimonials_data:
-        testimonial_obj = Testimonial(**testimonial_data)
-        await create_document("testimonials", testimonial_obj.dict())
+    await bulk_create("testimonials", [stamp(Testimonial, testimonial_data) for testimonial_data in testimonials_data])
     
     print(f"✓ {len(testimonials_data)} testimonials seeded")
 
@@ -187,9 +198,7 @@ async def seed_process_steps():
         }
     ]
     
-    for step_data in steps_data:
-        step_obj = ProcessStep(**step_data)
-        await create_document("process_steps", step_obj.dict())
+    await bulk_create("process_steps", [stamp(ProcessStep, step_data) for step_data in steps_data])
     
     print(f"✓ {len(steps_data)} process steps seeded")
 
@@ -208,9 +217,7 @@ async def seed_specifications():
         }
     ]
     
-    for spec_data in specs_data:
-        spec_obj = Specification(**spec_data)
-        await create_document("specifications", spec_obj.dict())
+    await bulk_create("specifications", [stamp(Specification, spec_data) for spec_data in specs_data])
     
     print(f"✓ {len(specs_data)} specifications seeded")
 
@@ -242,9 +249,7 @@ async def seed_navigation():
         }
     ]
     
-    for nav_item in nav_data:
-        nav_obj = NavigationItem(**nav_item)
-        await create_document("navigation", nav_obj.dict())
+    await bulk_create("navigation", [stamp(NavigationItem, nav_item) for nav_item in nav_data])
     
     print(f"✓ {len(nav_data)} navigation items seeded")
 
@@ -282,9 +287,7 @@ async def seed_footer_sections():
         }
     ]
     
-    for footer_item in footer_data:
-        footer_obj = FooterSection(**footer_item)
-        await create_document("footer_sections", footer_obj.dict())
+    await bulk_create("footer_sections", [stamp(FooterSection, footer_item) for footer_item in footer_data])
     
     print(f"✓ {len(footer_data)} footer sections seeded")
 
@@ -310,8 +313,7 @@ async def seed_site_settings():
         "order": 1
     }
     
-    settings_obj = SiteSettings(**settings_data)
-    await create_document("site_settings", settings_obj.dict())
+    await bulk_create("site_settings", [stamp(SiteSettings, settings_data)])
     print("✓ Site settings seeded")
 
 async def main():
@@ -325,15 +327,17 @@ async def main():
         # Create indexes
         await db_manager.create_indexes()
         
-        # Seed all data
-        await seed_hero_content()
-        await seed_features()
-        await seed_testimonials()
-        await seed_process_steps()
-        await seed_specifications()
-        await seed_navigation()
-        await seed_footer_sections()
-        await seed_site_settings()
+        # Seed all data; seeders write to disjoint collections, so run them concurrently
+        await asyncio.gather(
+            seed_hero_content(),
+            seed_features(),
+            seed_testimonials(),
+            seed_process_steps(),
+            seed_specifications(),
+            seed_navigation(),
+            seed_footer_sections(),
+            seed_site_settings(),
+        )
         
         print("\n✅ Database seeding completed successfully!")
         
@@ -1,11 +1,16 @@
 from fastapi import FastAPI, APIRouter
+from fastapi.responses import ORJSONResponse, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+import asyncio
+import uvicorn
+from contextlib import asynccontextmanager
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import List
 import uuid
 from datetime import datetime
@@ -17,27 +22,67 @@ sys.path.append(str(Path(__file__).parent))
 import content_api
 from content_api import router as content_router
 from database import db_manager
+from models import utcnow
 from cache import cache_manager
 
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Configure logging; set LOG_LEVEL=WARNING in production to drop per-request
+# INFO noise from libraries (uvicorn access logs are disabled below)
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+logging.basicConfig(
+    level=LOG_LEVEL,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Connect database and cache and create indexes before serving; flush and close on shutdown"""
+    try:
+        await db_manager.connect()
+        await db_manager.create_indexes()
+        await cache_manager.connect()
+        for batcher in content_api.write_batchers:
+            batcher.start()
+        logger.info("Database and cache connections established, indexes created")
+    except Exception as e:
+        logger.error(f"Failed to initialize database/cache: {e}")
+        raise
+    
+    yield
+    
+    # Flush queued writes, then close database and cache connections
+    await asyncio.gather(*(batcher.stop() for batcher in content_api.write_batchers))
+    await db_manager.disconnect()
+    await cache_manager.disconnect()
+    logger.info("Database and cache connections closed")
+
 # Create the main app without a prefix
-app = FastAPI(title="Atlas Robot API", version="1.0.0")
+app = FastAPI(title="Atlas Robot API", version="1.0.0", default_response_class=ORJSONResponse,
+              lifespan=lifespan)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
 # Define Models for existing status check endpoints
 class StatusCheck(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False, arbitrary_types_allowed=False)
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     client_name: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
 
 class StatusCheckCreate(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False, arbitrary_types_allowed=False)
+
     client_name: str
 
+# Validates and serializes a whole list in single pydantic-core calls
+STATUS_CHECK_LIST = TypeAdapter(List[StatusCheck])
+
 # Existing status check endpoints
 @api_router.get("/")
 async def root():
@@ -45,17 +90,20 @@ async def root():
 
 @api_router.post("/status", response_model=StatusCheck)
 async def create_status_check(input: StatusCheckCreate):
-    collection = await db_manager.get_collection("status_checks")
-    status_dict = input.dict()
-    status_obj = StatusCheck(**status_dict)
-    await collection.insert_one(status_obj.dict())
+    collection = db_manager.get_collection("status_checks")
+    status_obj = StatusCheck(client_name=input.client_name)
+    await collection.insert_one(status_obj.model_dump())
     return status_obj
 
 @api_router.get("/status", response_model=List[StatusCheck])
 async def get_status_checks():
-    collection = await db_manager.get_collection("status_checks")
-    status_checks = await collection.find().to_list(1000)
-    return [StatusCheck(**status_check) for status_check in status_checks]
+    collection = db_manager.get_collection("status_checks")
+    status_checks = await collection.find({}, {"_id": 0}).to_list(1000)
+    # One validation pass over the list; returning a Response skips FastAPI's own
+    return Response(
+        STATUS_CHECK_LIST.dump_json(STATUS_CHECK_LIST.validate_python(status_checks)),
+        media_type="application/json"
+    )
 
 # Include content API routes
 api_router.include_router(content_router, prefix="/content")
@@ -63,35 +111,41 @@ api_router.include_router(content_router, prefix="/content")
 # Include the router in the main app
 app.include_router(api_router)
 
+# Compress text-heavy JSON; tiny bodies and 304s are not worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+# Explicit lists let browsers cache preflights for max_age seconds.
+# FRONTEND_ORIGIN may hold several comma-separated origins
+FRONTEND_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get("FRONTEND_ORIGIN", "http://localhost:3000").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_credentials=True,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=FRONTEND_ORIGINS,
+    allow_methods=["GET", "POST", "PUT", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization", "If-None-Match", "X-Cache-Bypass"],
+    expose_headers=["ETag", "X-From-Stale-Cache"],
+    max_age=600,
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database connection, cache, and create indexes"""
-    try:
-        await db_manager.connect()
-        await db_manager.create_indexes()
-        cache_manager.connect()
-        logger.info("Database and cache connections established, indexes created")
-    except Exception as e:
-        logger.error(f"Failed to initialize database/cache: {e}")
-        raise
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Close database and cache connections"""
-    await db_manager.disconnect()
-    logger.info("Database and cache connections closed")
+if __name__ == "__main__":
+    # Single worker unless WEB_CONCURRENCY says otherwise: the local content
+    # cache is per process, so extra workers can each serve a pre-write copy
+    # for up to LOCAL_CACHE_TTL after a POST handled elsewhere. Each worker
+    # opens its own database and cache connections in lifespan.
+    # uvloop and httptools come with uvicorn[standard]
+    workers = max(1, int(os.environ.get("WEB_CONCURRENCY", 1)))
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    uvicorn.run(
+        "server:app",
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", 8001)),
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_level=LOG_LEVEL.lower(),
+    )
@@ -0,0 +1,16 @@
+import pytest
+
+from content_api import cache_bypass
+
+
+def test_header_is_ignored_by_default(monkeypatch):
+    monkeypatch.delenv("CACHE_BYPASS_ENABLED", raising=False)
+
+    assert cache_bypass("1") is False
+
+
+@pytest.mark.parametrize("header, expected", [("1", True), ("0", False), (None, False)])
+def test_header_is_honoured_when_enabled(monkeypatch, header, expected):
+    monkeypatch.setenv("CACHE_BYPASS_ENABLED", "true")
+
+    assert cache_bypass(header) is expected
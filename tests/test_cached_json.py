@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+import cache
+from cache import EMPTY_JSON_LIST, InMemoryCache, get_cached_json
+
+
+@pytest.fixture
+def tiers(monkeypatch):
+    """A fresh local tier and an in-memory stand-in for Redis"""
+    local, remote = InMemoryCache(), InMemoryCache()
+    monkeypatch.setattr(cache, "local_cache", local)
+    monkeypatch.setattr(cache.cache_manager, "redis_client", remote)
+    return local, remote
+
+
+def test_cached_empty_list_in_the_local_tier_is_a_miss(tiers):
+    local, _ = tiers
+    local.set("content:features", EMPTY_JSON_LIST, 30)
+
+    assert asyncio.run(get_cached_json("features")) is None
+
+
+def test_cached_empty_list_in_redis_is_a_miss(tiers):
+    asyncio.run(cache.cache_manager.set_json("content:features", EMPTY_JSON_LIST))
+
+    assert asyncio.run(get_cached_json("features")) is None
+
+
+def test_cached_list_in_redis_is_a_hit_and_fills_the_local_tier(tiers):
+    local, _ = tiers
+    asyncio.run(cache.cache_manager.set_json("content:features", b'[{"id":"a"}]'))
+
+    assert asyncio.run(get_cached_json("features")) == b'[{"id":"a"}]'
+    assert local.get("content:features") == b'[{"id":"a"}]'
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+import database
+from database import LISTING_INDEXES, get_all_documents
+
+
+class FakeCursor:
+    def __init__(self, query):
+        self.query = query
+
+    def sort(self, *args):
+        return self
+
+    def limit(self, limit):
+        return self
+
+    def hint(self, index_name):
+        self.query["hint"] = index_name
+        return self
+
+    async def to_list(self, length):
+        return []
+
+
+class FakeCollection:
+    def __init__(self):
+        self.queries = []
+
+    def find(self, filter_dict, projection):
+        query = {"filter": filter_dict, "projection": projection, "hint": None}
+        self.queries.append(query)
+        return FakeCursor(query)
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    fake = FakeCollection()
+    monkeypatch.setattr(database.db_manager, "get_collection", lambda collection_name: fake)
+    return fake
+
+
+def test_unfiltered_listing_is_pinned_to_the_covering_index(collection):
+    asyncio.run(get_all_documents("features", {"is_active": True}, "order", 1))
+
+    assert collection.queries[0]["hint"] == LISTING_INDEXES["features"][0]
+
+
+@pytest.mark.parametrize("collection_name, field", [
+    ("features", "category"),
+    ("process_steps", "step_type"),
+    ("navigation", "nav_type"),
+])
+def test_filtered_listing_is_left_to_the_planner(collection, collection_name, field):
+    asyncio.run(get_all_documents(collection_name, {"is_active": True, field: "x"}, "order", 1))
+
+    query = collection.queries[0]
+    assert query["hint"] is None
+    # Still projected onto the listing fields, so responses keep their shape
+    assert field in query["projection"]
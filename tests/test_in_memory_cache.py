@@ -0,0 +1,33 @@
+from cache import InMemoryCache
+
+
+def test_overwrites_do_not_grow_the_expiry_heap_without_bound():
+    cache = InMemoryCache(maxsize=10)
+
+    for i in range(10_000):
+        cache.set(f"key:{i % 5}", b"value", ttl=86400)
+
+    assert len(cache.cache) == 5
+    limit = InMemoryCache.HEAP_SLACK * len(cache.expiry) + 2 * InMemoryCache.SWEEP_INTERVAL
+    assert len(cache._expiry_heap) <= limit
+
+
+def test_evicted_keys_do_not_grow_the_expiry_heap_without_bound():
+    cache = InMemoryCache(maxsize=100)
+
+    for i in range(10_000):
+        cache.set(f"key:{i}", b"value", ttl=86400)
+
+    assert len(cache.cache) == 100
+    limit = InMemoryCache.HEAP_SLACK * cache.maxsize + 2 * InMemoryCache.SWEEP_INTERVAL
+    assert len(cache._expiry_heap) <= limit
+
+
+def test_compaction_keeps_live_expiries():
+    cache = InMemoryCache(maxsize=10)
+
+    for i in range(1_000):
+        cache.set(f"key:{i % 3}", i, ttl=86400)
+
+    assert {key for _, key in cache._expiry_heap} == {"key:0", "key:1", "key:2"}
+    assert cache.get("key:0") == 999
@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+
+import models
+from models import Feature
+
+
+def test_updated_at_defaults_to_created_at():
+    feature = Feature(title="t", description="d", icon_svg="<svg/>")
+
+    assert feature.updated_at == feature.created_at
+
+
+def test_explicit_updated_at_is_kept():
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    updated_at = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+    feature = Feature(title="t", description="d", icon_svg="<svg/>",
+                      created_at=created_at, updated_at=updated_at)
+
+    assert (feature.created_at, feature.updated_at) == (created_at, updated_at)
+
+
+def test_only_listing_create_models_accept_order():
+    ordered = {"FeatureCreate", "TestimonialCreate", "ProcessStepCreate", "SpecificationCreate",
+               "NavigationItemCreate", "FooterSectionCreate"}
+    unordered = {"HeroContentCreate", "NewsletterSignupCreate", "SiteSettingsCreate",
+                 "ContentPageCreate", "ContactFormCreate", "PageViewCreate"}
+
+    for name in ordered:
+        assert "order" in getattr(models, name).model_fields, name
+    for name in unordered:
+        assert "order" not in getattr(models, name).model_fields, name
@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+import database
+from database import DUPLICATE_KEY, WriteBatcher
+
+
+class FakeBulkCreate:
+    """Stands in for database.bulk_create, recording what each call was given"""
+
+    def __init__(self, failures=None, delay=0.0):
+        self.calls = []
+        self.written = []
+        self.failures = list(failures or [])
+        self.delay = delay
+
+    async def __call__(self, collection_name, documents):
+        self.calls.append([document["n"] for document in documents])
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.failures:
+            failure = self.failures.pop(0)
+            if failure is not None:
+                raise failure(documents)
+        self.written.extend(document["n"] for document in documents)
+        return len(documents)
+
+
+@pytest.fixture
+def bulk_create(monkeypatch):
+    def install(**kwargs):
+        fake = FakeBulkCreate(**kwargs)
+        monkeypatch.setattr(database, "bulk_create", fake)
+        return fake
+    return install
+
+
+def documents(count):
+    return [{"n": n} for n in range(count)]
+
+
+def test_writes_full_batches_without_waiting_for_the_delay(bulk_create):
+    fake = bulk_create()
+
+    async def scenario():
+        batcher = WriteBatcher("page_views", max_size=3, max_delay_ms=10_000)
+        batcher.start()
+        for document in documents(6):
+            await batcher.add(document)
+        await asyncio.sleep(0.05)
+        calls = list(fake.calls)
+        await batcher.stop()
+        return calls
+
+    assert asyncio.run(scenario()) == [[0, 1, 2], [3, 4, 5]]
+
+
+def test_writes_partial_batch_after_the_delay(bulk_create):
+    fake = bulk_create()
+
+    async def scenario():
+        batcher = WriteBatcher("page_views", max_size=100, max_delay_ms=20)
+        batcher.start()
+        for document in documents(2):
+            await batcher.add(document)
+        await asyncio.sleep(0.1)
+        calls = list(fake.calls)
+        await batcher.stop()
+        return calls
+
+    assert asyncio.run(scenario()) == [[0, 1]]
+
+
+def test_stop_finishes_the_batch_being_written(bulk_create):
+    fake = bulk_create(delay=0.05)
+
+    async def scenario():
+        batcher = WriteBatcher("page_views", max_size=2, max_delay_ms=10_000)
+        batcher.start()
+        for document in documents(5):
+            await batcher.add(document)
+        # Let the writer pick up the first batch and start writing it
+        await asyncio.sleep(0.01)
+        await batcher.stop()
+
+    asyncio.run(scenario())
+    assert sorted(fake.written) == [0, 1, 2, 3, 4]
+
+
+def test_retries_a_batch_after_a_transient_error(bulk_create):
+    fake = bulk_create(failures=[lambda _: AutoReconnect("primary stepped down")])
+
+    async def scenario():
+        batcher = WriteBatcher("page_views", retry_delay_ms=1)
+        await batcher.write(documents(3))
+
+    asyncio.run(scenario())
+    assert fake.calls == [[0, 1, 2], [0, 1, 2]]
+    assert fake.written == [0, 1, 2]
+
+
+def test_retries_only_failed_documents_and_skips_duplicates(bulk_create):
+    def partial_failure(batch):
+        return BulkWriteError({"writeErrors": [
+            {"index": 1, "code": DUPLICATE_KEY, "errmsg": "duplicate"},
+            {"index": 2, "code": 91, "errmsg": "shutdown in progress"},
+        ]})
+
+    fake = bulk_create(failures=[partial_failure])
+
+    async def scenario():
+        batcher = WriteBatcher("page_views", retry_delay_ms=1)
+        await batcher.write(documents(3))
+
+    asyncio.run(scenario())
+    assert fake.calls == [[0, 1, 2], [2]]
+
+
+def test_gives_up_after_max_retries(bulk_create):
+    fake = bulk_create(failures=[lambda _: AutoReconnect("down")] * 10)
+
+    async def scenario():
+        batcher = WriteBatcher("page_views", max_retries=2, retry_delay_ms=1)
+        await batcher.write(documents(1))
+
+    asyncio.run(scenario())
+    assert len(fake.calls) == 3
+    assert fake.written == []